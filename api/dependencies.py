@@ -2,9 +2,12 @@
 FastAPI Dependencies - JWT Validation and Authentication
 """
 import os
+import time
+import hashlib
+from collections import OrderedDict
 import jwt
 from fastapi import Header, HTTPException, status
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 # Atlas JWT Configuration
 ATLAS_JWT_SECRET = os.getenv("ATLAS_JWT_SECRET", "your-secret-key-change-in-production")
@@ -12,6 +15,41 @@ ATLAS_API_URL = os.getenv("ATLAS_API_URL", "http://localhost:8000")
 # Allow bypassing auth for local development
 ALLOW_LOCAL_AUTH_BYPASS = os.getenv("ALLOW_LOCAL_AUTH_BYPASS", "true").lower() == "true"
 
+# Decoded token payloads, keyed by a hash of the token so raw JWTs are not kept in memory
+TOKEN_CACHE_MAXSIZE = 256
+TOKEN_CACHE_TTL = 60.0
+_token_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _token_key(token: str) -> str:
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """Decode a JWT, reusing the payload verified within the last TOKEN_CACHE_TTL seconds"""
+    key = _token_key(token)
+    now = time.time()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if now < expires_at:
+            _token_cache.move_to_end(key)
+            return dict(payload)
+        del _token_cache[key]
+    
+    payload = jwt.decode(token, ATLAS_JWT_SECRET, algorithms=["HS256"])
+    
+    # Never keep a payload past the token's own expiry
+    expires_at = now + TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    _token_cache[key] = (expires_at, payload)
+    if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+        _token_cache.popitem(last=False)
+    return dict(payload)
+
+
 async def verify_atlas_token(authorization: Optional[str] = Header(None)) -> Dict[str, Any]:
     """
     Verify Atlas JWT token from Authorization header
@@ -59,8 +97,7 @@ async def verify_atlas_token(authorization: Optional[str] = Header(None)) -> Dic
         }
     
     try:
-        payload = jwt.decode(token, ATLAS_JWT_SECRET, algorithms=["HS256"])
-        return payload
+        return _decode_token(token)
     except jwt.ExpiredSignatureError:
         if ALLOW_LOCAL_AUTH_BYPASS:
             return {
@@ -53,6 +53,35 @@ class NotificationAgent:
         
         return {"success": True, "notification": notification}
     
+    def send_notifications_bulk(self, pending: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send several notifications, loading and saving the notification store once"""
+        notifications = self.data_manager.load_data("notifications") or []
+        created_at = datetime.now().isoformat()
+        
+        sent = []
+        for offset, item in enumerate(pending, start=1):
+            sent.append({
+                "id": str(len(notifications) + offset),
+                "recipient": item["recipient"],
+                "title": item["title"],
+                "message": item["message"],
+                "type": item.get("notification_type", "info"),
+                "priority": item.get("priority", "normal"),
+                "status": "sent",
+                "created_at": created_at,
+                "read": False
+            })
+        
+        if sent:
+            notifications.extend(sent)
+            self.data_manager.save_data("notifications", notifications)
+        
+        for notification in sent:
+            if notification["type"] in ["task_assignment", "deadline_reminder", "feedback"]:
+                self.send_email(notification["recipient"], notification["title"], notification["message"])
+        
+        return {"success": True, "notifications": sent}
+    
     def send_email(self, recipient: str, subject: str, body: str) -> bool:
         """Send email notification (SMTP-ready)"""
         smtp_host = os.getenv("SMTP_HOST")
@@ -92,7 +121,10 @@ class NotificationAgent:
             try:
                 due_date = datetime.fromisoformat(task["due_date"])
                 days_remaining = (due_date - datetime.now()).days
-                if days_remaining <= 1:
+            except (ValueError, TypeError):
+                return False
+            if days_remaining <= 1:
+                try:
                     self.send_notification(
                         recipient=task["assigned_to"],
                         title="Task Deadline Reminder",
@@ -101,8 +133,8 @@ class NotificationAgent:
                         priority="high"
                     )
                     return True
-            except:
-                pass
+                except Exception as e:
+                    print(f"Error sending task reminder: {e}")
             return False
         
         try:
@@ -2,18 +2,58 @@
 Data Manager - Direct Supabase Interface
 Simple wrapper around SupabaseClient
 """
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from components.managers.supabase_client import SupabaseClient
 
 
 class DataManager:
     """Simple data manager using Supabase directly"""
     
+    # Seconds a loaded table is reused; long enough to collapse the repeated loads
+    # the agents make internally during one fan-out onto a single query. The MCP
+    # server's per-request preload only covers its own reads, not the agents' calls
+    CACHE_TTL = 0.5
+    
     def __init__(self):
         self.supabase = SupabaseClient()
+        self._cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._cache_lock = threading.Lock()
+        # Bumped on every invalidation; a load only caches its rows if no write
+        # invalidated the cache while it was fetching
+        self._generation = 0
+    
+    def invalidate(self, filename: Optional[str] = None) -> None:
+        """Drop cached rows for one table, or for all tables"""
+        with self._cache_lock:
+            self._generation += 1
+            if filename is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(filename, None)
+    
+    @contextmanager
+    def _writing(self, filename: str):
+        """Invalidate a table around a write, so loads overlapping it can't cache pre-write rows"""
+        self.invalidate(filename)
+        try:
+            yield
+        finally:
+            self.invalidate(filename)
     
     def load_data(self, filename: str) -> Optional[List[Dict[str, Any]]]:
-        """Load data from Supabase"""
+        """Load data from Supabase, reusing rows loaded within the last CACHE_TTL seconds"""
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(filename)
+            generation = self._generation
+        if cached is not None and now - cached[0] < self.CACHE_TTL:
+            # Callers append to the list and add keys to rows, so hand out copies of both
+            return [dict(row) for row in cached[1]]
+        
         mapping = {
             "employees": "get_employees",
             "tasks": "get_tasks",
@@ -28,15 +68,28 @@ class DataManager:
         method_name = mapping.get(filename)
         if method_name:
             method = getattr(self.supabase, method_name)
-            data = method()
-            return data if data else []
+            data = method() or []
+            with self._cache_lock:
+                if self._generation == generation:
+                    self._cache[filename] = (now, data)
+            return [dict(row) for row in data]
         return []
     
+    def load_many(self, filenames: List[str], max_workers: int = 8) -> Dict[str, List[Dict[str, Any]]]:
+        """Load several datasets in one call, fetching them concurrently so their round-trips overlap"""
+        filenames = list(dict.fromkeys(filenames))
+        if len(filenames) <= 1:
+            return {filename: self.load_data(filename) or [] for filename in filenames}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(filenames))) as executor:
+            results = executor.map(self.load_data, filenames)
+            return {filename: data or [] for filename, data in zip(filenames, results)}
+    
     def save_data(self, filename: str, data: Any) -> bool:
         """Save data to Supabase (bulk save for backward compatibility)"""
         if not isinstance(data, list):
             return False
         
+        self.invalidate(filename)
         try:
             # For bulk saves, update each item
             for item in data:
@@ -55,7 +108,7 @@ class DataManager:
                         self.supabase.update_achievement(item_id, update_data)
                     elif filename == "feedback":
                         self.supabase.update_feedback(item_id, update_data)
-                except:
+                except Exception:
                     # If update fails, try insert
                     try:
                         if filename == "tasks":
@@ -66,50 +119,62 @@ class DataManager:
                             self.supabase.create_achievement(item)
                         elif filename == "feedback":
                             self.supabase.create_feedback(item)
-                    except:
-                        pass
+                    except Exception as e:
+                        print(f"Error saving {filename} item {item_id}: {e}")
             return True
         except Exception as e:
             print(f"Error saving {filename}: {e}")
             return False
+        finally:
+            self.invalidate(filename)
     
     # Direct access to Supabase methods
     def create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create task"""
-        return self.supabase.create_task(task_data)
+        with self._writing("tasks"):
+            return self.supabase.create_task(task_data)
     
     def update_task(self, task_id: str, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update task"""
-        return self.supabase.update_task(task_id, task_data)
+        with self._writing("tasks"):
+            return self.supabase.update_task(task_id, task_data)
     
     def create_goal(self, goal_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create goal"""
-        return self.supabase.create_goal(goal_data)
+        with self._writing("goals"):
+            return self.supabase.create_goal(goal_data)
     
     def update_goal(self, goal_id: str, goal_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update goal"""
-        return self.supabase.update_goal(goal_id, goal_data)
+        with self._writing("goals"):
+            return self.supabase.update_goal(goal_id, goal_data)
     
     def create_feedback(self, feedback_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create feedback"""
-        return self.supabase.create_feedback(feedback_data)
+        with self._writing("feedback"):
+            return self.supabase.create_feedback(feedback_data)
     
     def create_achievement(self, achievement_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create achievement"""
-        return self.supabase.create_achievement(achievement_data)
+        with self._writing("achievements"):
+            return self.supabase.create_achievement(achievement_data)
     
     def update_achievement(self, achievement_id: str, achievement_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update achievement"""
-        return self.supabase.update_achievement(achievement_id, achievement_data)
+        with self._writing("achievements"):
+            return self.supabase.update_achievement(achievement_id, achievement_data)
     
     def create_employee(self, employee_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create employee"""
-        return self.supabase.create_employee(employee_data)
+        with self._writing("employees"):
+            return self.supabase.create_employee(employee_data)
     
     def update_employee(self, employee_id: str, employee_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update employee"""
-        return self.supabase.update_employee(employee_id, employee_data)
+        with self._writing("employees"):
+            return self.supabase.update_employee(employee_id, employee_data)
     
     def delete_employee(self, employee_id: str) -> bool:
         """Delete employee"""
-        return self.supabase.delete_employee(employee_id)
\ No newline at end of file
+        with self._writing("employees"):
+            return self.supabase.delete_employee(employee_id)
\ No newline at end of file
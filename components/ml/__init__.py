@@ -0,0 +1,2 @@
+# ML models package
+
@@ -6,7 +6,7 @@ Output: Performance score (0-100)
 """
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 import pickle
 import os
 from datetime import datetime, timedelta
@@ -33,15 +33,21 @@ except ImportError:
 class PerformanceScorer:
     """ML-based performance scoring model"""
     
-    def __init__(self, model_type: str = "random_forest", model_path: Optional[str] = None):
+    # Columns of the feature matrix, in order
+    FEATURE_NAMES = ("task_quality", "sentiment", "workload_balance")
+    
+    def __init__(self, model_type: str = "random_forest", model_path: Optional[str] = None,
+                 n_jobs: int = -1):
         """
         Initialize performance scorer
         
         Args:
             model_type: "random_forest" or "xgboost"
             model_path: Path to saved model (optional)
+            n_jobs: Worker threads used for training (-1 = all cores)
         """
         self.model_type = model_type
+        self.n_jobs = n_jobs
         self.model = None
         self.scaler = StandardScaler() if SKLEARN_AVAILABLE else None
         self.is_trained = False
@@ -69,7 +75,8 @@ class PerformanceScorer:
             print(f"🔍 [DEBUG] Error loading model: {e}")
             pass
     
-    def extract_features(self, employee_data: Dict[str, Any]) -> np.ndarray:
+    @staticmethod
+    def extract_features(employee_data: Dict[str, Any]) -> np.ndarray:
         """
         Extract features from employee data
         
@@ -152,21 +159,41 @@ class PerformanceScorer:
         
         return np.array(features).reshape(1, -1)
     
-    def train(self, training_data: List[Dict[str, Any]], target_scores: List[float]):
+    @classmethod
+    def compute_features(cls, training_data: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Build the feature matrix for a list of employee data dictionaries
+        
+        Returns:
+            float32 array of shape (n_samples, len(FEATURE_NAMES))
+        """
+        X = np.empty((len(training_data), len(cls.FEATURE_NAMES)), dtype=np.float32)
+        for i, emp_data in enumerate(training_data):
+            X[i] = cls.extract_features(emp_data)[0]
+        return X
+    
+    def train(self, training_data: Union[np.ndarray, List[Dict[str, Any]]], target_scores: Union[np.ndarray, List[float]],
+              use_dask: bool = False):
         """
         Train the model on historical data
         
         Args:
-            training_data: List of employee data dictionaries
+            training_data: Feature matrix from compute_features (n_samples, n_features),
+                or a list of employee data dictionaries to extract it from
             target_scores: List of actual performance scores (0-100)
+            use_dask: Fit XGBoost on a local Dask cluster (for very large sample counts)
         """
         if not SKLEARN_AVAILABLE:
             print("❌ scikit-learn not available. Cannot train model.")
             return
         
         # Extract features
-        X = np.array([self.extract_features(emp_data).flatten() for emp_data in training_data])
-        y = np.array(target_scores)
+        if isinstance(training_data, np.ndarray):
+            # Tree models gain nothing from float64 features; float32 halves the data moved per pass
+            X = training_data.astype(np.float32, copy=False)
+        else:
+            X = self.compute_features(training_data)
+        y = np.asarray(target_scores, dtype=float)
         
         # Scale features
         X_scaled = self.scaler.fit_transform(X)
@@ -182,13 +209,18 @@ class PerformanceScorer:
                 n_estimators=100,
                 max_depth=10,
                 random_state=42,
-                n_jobs=-1
+                n_jobs=self.n_jobs
             )
         elif self.model_type == "xgboost" and XGBOOST_AVAILABLE:
+            # Histogram-based splits grow leaf-wise; memory scales with bins, not rows
             self.model = xgb.XGBRegressor(
                 n_estimators=100,
                 max_depth=6,
                 learning_rate=0.1,
+                tree_method="hist",
+                grow_policy="lossguide",
+                max_bin=256,
+                n_jobs=self.n_jobs,
                 random_state=42
             )
         else:
@@ -197,10 +229,15 @@ class PerformanceScorer:
                 n_estimators=100,
                 max_depth=10,
                 random_state=42,
-                n_jobs=-1
+                n_jobs=self.n_jobs
             )
         
-        self.model.fit(X_train, y_train)
+        if use_dask and self.model_type == "xgboost" and XGBOOST_AVAILABLE:
+            self._fit_with_dask(X_train, y_train)
+        else:
+            if use_dask:
+                print("⚠️ Dask training is only supported for XGBoost, training in-process")
+            self.model.fit(X_train, y_train)
         
         # Evaluate
         y_pred = self.model.predict(X_test)
@@ -213,6 +250,36 @@ class PerformanceScorer:
         # Save model
         self.save_model()
     
+    def _fit_with_dask(self, X_train: np.ndarray, y_train: np.ndarray):
+        """Fit the configured XGBRegressor across a local Dask cluster, keeping an in-process copy"""
+        try:
+            import dask.array as da
+            from dask.distributed import Client, LocalCluster
+            from xgboost import dask as dxgb
+        except ImportError:
+            print("⚠️ dask[distributed] not available, training in-process. Install with: pip install \"dask[distributed]\"")
+            self.model.fit(X_train, y_train)
+            return
+        
+        # n_jobs counts threads; give each worker process a single thread so the
+        # cluster uses n_jobs cores in total instead of n_jobs processes x all cores
+        n_workers = (os.cpu_count() or 1) if self.n_jobs == -1 else max(1, self.n_jobs)
+        with LocalCluster(n_workers=n_workers, threads_per_worker=1) as cluster, Client(cluster) as client:
+            # One partition per worker so every worker holds a share of the rows
+            n_partitions = max(1, len(client.scheduler_info()["workers"]))
+            rows_per_partition = max(1, -(-len(X_train) // n_partitions))
+            dX = da.from_array(X_train, chunks=(rows_per_partition, X_train.shape[1]))
+            dy = da.from_array(y_train, chunks=rows_per_partition)
+            
+            regressor = dxgb.DaskXGBRegressor(**self.model.get_params())
+            regressor.client = client
+            regressor.fit(dX, dy)
+            booster = regressor.get_booster()
+        
+        # Load the trained booster into the plain regressor so predict/save_model
+        # work without a cluster
+        self.model.load_model(booster.save_raw("json"))
+    
     def predict(self, employee_data: Dict[str, Any]) -> float:
         """
         Predict performance score for an employee
@@ -6,6 +6,7 @@ import asyncio
 import json
 import sys
 from pathlib import Path
+from types import MappingProxyType
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -25,31 +26,33 @@ from mcp_server.server import (
     handle_record_attendance
 )
 
+# Tool name -> handler, built once at import
+_HANDLERS = MappingProxyType({
+    "evaluate_all_employees": handle_evaluate_all_employees,
+    "detect_all_risks": handle_detect_all_risks,
+    "check_overdue_tasks": handle_check_overdue_tasks,
+    "check_overdue_goals": handle_check_overdue_goals,
+    "assess_workload": handle_assess_workload,
+    "automated_daily_check": handle_automated_daily_check,
+    "send_notification": handle_send_notification,
+    "get_employee_stats": handle_get_employee_stats,
+    "generate_performance_report": handle_generate_performance_report,
+    "generate_project_report": handle_generate_project_report,
+    "export_data": handle_export_data,
+    "record_attendance": handle_record_attendance
+})
+
 
 async def run_tool(tool_name: str, args: dict):
     """Run a specific tool"""
-    handlers = {
-        "evaluate_all_employees": handle_evaluate_all_employees,
-        "detect_all_risks": handle_detect_all_risks,
-        "check_overdue_tasks": handle_check_overdue_tasks,
-        "check_overdue_goals": handle_check_overdue_goals,
-        "assess_workload": handle_assess_workload,
-        "automated_daily_check": handle_automated_daily_check,
-        "send_notification": handle_send_notification,
-        "get_employee_stats": handle_get_employee_stats,
-        "generate_performance_report": handle_generate_performance_report,
-        "generate_project_report": handle_generate_project_report,
-        "export_data": handle_export_data,
-        "record_attendance": handle_record_attendance
-    }
-    
-    if tool_name not in handlers:
+    handler = _HANDLERS.get(tool_name)
+    if handler is None:
         print(f"Unknown tool: {tool_name}")
-        print(f"Available tools: {', '.join(handlers.keys())}")
+        print(f"Available tools: {', '.join(_HANDLERS)}")
         return
     
     try:
-        result = await handlers[tool_name](args)
+        result = await handler(args)
         if result:
             print(result[0].text)
     except Exception as e:
@@ -24,19 +24,26 @@ async def examples():
     print("MCP Automation Examples")
     print("=" * 60)
     
+    # Examples 1-3 are independent, so run them concurrently
+    eval_result, risk_result, overdue_result = await asyncio.gather(
+        handle_evaluate_all_employees({"save_results": True}),
+        handle_detect_all_risks({}),
+        handle_check_overdue_tasks({"send_notifications": False})
+    )
+    
     # Example 1: Evaluate all employees
     print("\n1. Evaluating all employees...")
-    result = await handle_evaluate_all_employees({"save_results": True})
+    result = eval_result
     print(result[0].text[:500] + "..." if len(result[0].text) > 500 else result[0].text)
     
     # Example 2: Detect risks
     print("\n2. Detecting all risks...")
-    result = await handle_detect_all_risks({})
+    result = risk_result
     print(result[0].text[:500] + "..." if len(result[0].text) > 500 else result[0].text)
     
     # Example 3: Check overdue tasks
     print("\n3. Checking overdue tasks...")
-    result = await handle_check_overdue_tasks({"send_notifications": False})
+    result = overdue_result
     print(result[0].text[:500] + "..." if len(result[0].text) > 500 else result[0].text)
     
     # Example 4: Get employee stats (if employees exist)
@@ -3,649 +3,699 @@ MCP Server for Employee Performance Report System
 Provides automation tools for performance evaluation, notifications, reports, and more.
 """
 import asyncio
+import functools
+import hashlib
+import importlib.util
 import json
-import sys
+import time
 import httpx
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from pathlib import Path
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
-# Add parent directory to path to import project modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-try:
+if importlib.util.find_spec("mcp") is not None:
     from mcp.server import Server
     from mcp.server.stdio import stdio_server
     from mcp.types import Tool, TextContent
-except ImportError:
-    # Fallback for alternative MCP implementations
-    try:
-        from mcp import Server, stdio_server, Tool, TextContent
-    except ImportError:
-        print("Warning: MCP library not found. Install with: pip install mcp")
-        # Create minimal stubs for development
-        class Server:
-            def __init__(self, name):
-                self.name = name
-            def list_tools(self):
-                pass
-            def call_tool(self):
-                pass
-            def run(self, *args, **kwargs):
-                pass
-            def create_initialization_options(self):
-                return {}
-        
-        class Tool:
-            def __init__(self, **kwargs):
-                pass
-        
-        class TextContent:
-            def __init__(self, **kwargs):
-                pass
-        
-        def stdio_server():
-            return None, None
+else:
+    print("Warning: MCP library not found. Install with: pip install mcp")
+    # Create minimal stubs for development
+    class Server:
+        def __init__(self, name):
+            self.name = name
+        def list_tools(self):
+            pass
+        def call_tool(self):
+            pass
+        def run(self, *args, **kwargs):
+            pass
+        def create_initialization_options(self):
+            return {}
+    
+    class Tool:
+        def __init__(self, **kwargs):
+            pass
+    
+    class TextContent:
+        def __init__(self, **kwargs):
+            pass
+    
+    def stdio_server():
+        return None, None
 from components.managers.data_manager import DataManager
-from components.agents.performance_agent import EnhancedPerformanceAgent
-from components.agents.notification_agent import NotificationAgent
-from components.agents.reporting_agent import ReportingAgent
-from components.agents.goal_agent import GoalAgent
-from components.agents.export_agent import ExportAgent
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# httpx only negotiates HTTP/2 when the h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Maximum number of employee evaluations running at once
+EVALUATION_CONCURRENCY = 16
+
+# Statuses for which tasks/goals are no longer tracked as overdue
+_DONE_STATUSES = frozenset({"completed", "cancelled"})
+
+# Task statuses counted towards an employee's workload
+ACTIVE_TASK_STATUSES = frozenset({"pending", "in_progress"})
+
+# Overdue notification constants
+OVERDUE_TASK_TITLE = "Overdue Task"
+OVERDUE_GOAL_TITLE = "Overdue Goal"
+OVERDUE_NOTIFICATION_TYPE = "warning"
 
 # Initialize server
 server = Server("employee-performance-automation")
 
-# Initialize data manager and agents
+# Atlas API base URL (the token varies per call, so auth headers are sent per request)
+ATLAS_BASE_URL = "http://localhost:8003"
+
+# Shared Atlas HTTP client so tool calls reuse pooled keep-alive connections
+_atlas_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared Atlas client, creating it on first use"""
+    global _atlas_client
+    if _atlas_client is None or _atlas_client.is_closed:
+        _atlas_client = httpx.AsyncClient(
+            base_url=ATLAS_BASE_URL,
+            http2=HTTP2_AVAILABLE,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+    return _atlas_client
+
+# Initialize data manager
 data_manager = DataManager()
-performance_agent = EnhancedPerformanceAgent(data_manager)
-notification_agent = NotificationAgent(data_manager)
-reporting_agent = ReportingAgent(data_manager)
-goal_agent = GoalAgent(data_manager, notification_agent)
-export_agent = ExportAgent(data_manager)
 
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List all available automation tools"""
-    return [
-        Tool(
-            name="evaluate_all_employees",
-            description="Automatically evaluate performance for all employees",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "save_results": {
-                        "type": "boolean",
-                        "description": "Whether to save evaluation results (default: True)",
-                        "default": True
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="detect_all_risks",
-            description="Automatically detect all risks in the system (employees, projects, tasks, performance)",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="send_notification",
-            description="Send a notification to an employee",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "employee_id": {
-                        "type": "string",
-                        "description": "Employee ID to send notification to"
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Notification title"
-                    },
-                    "message": {
-                        "type": "string",
-                        "description": "Notification message"
-                    },
-                    "notification_type": {
-                        "type": "string",
-                        "description": "Type of notification (info, warning, success, error)",
-                        "enum": ["info", "warning", "success", "error"]
-                    }
-                },
-                "required": ["employee_id", "title", "message"]
-            }
-        ),
-        Tool(
-            name="generate_performance_report",
-            description="Generate a performance report for an employee",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "employee_id": {
-                        "type": "string",
-                        "description": "Employee ID to generate report for"
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "Report format (json, pdf, csv)",
-                        "enum": ["json", "pdf", "csv"],
-                        "default": "json"
-                    }
-                },
-                "required": ["employee_id"]
-            }
-        ),
-        Tool(
-            name="check_overdue_tasks",
-            description="Check for overdue tasks and send notifications",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "send_notifications": {
-                        "type": "boolean",
-                        "description": "Whether to send notifications for overdue tasks (default: True)",
-                        "default": True
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="check_overdue_goals",
-            description="Check for overdue goals and send notifications",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "send_notifications": {
-                        "type": "boolean",
-                        "description": "Whether to send notifications for overdue goals (default: True)",
-                        "default": True
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="assess_workload",
-            description="Assess workload for all employees and identify overloaded employees",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "threshold": {
-                        "type": "integer",
-                        "description": "Maximum number of active tasks before considered overloaded (default: 10)",
-                        "default": 10
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="generate_project_report",
-            description="Generate a comprehensive report for a project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID to generate report for"
-                    }
-                },
-                "required": ["project_id"]
-            }
-        ),
-        Tool(
-            name="export_data",
-            description="Export data to CSV or PDF format",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "data_type": {
-                        "type": "string",
-                        "description": "Type of data to export",
-                        "enum": ["projects", "tasks", "employees", "performances", "goals", "feedback"]
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "Export format (csv, pdf)",
-                        "enum": ["csv", "pdf"],
-                        "default": "csv"
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Optional output file path"
-                    }
-                },
-                "required": ["data_type"]
-            }
-        ),
-        Tool(
-            name="record_attendance",
-            description="Record employee attendance (check-in or check-out)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "employee_id": {
-                        "type": "string",
-                        "description": "Employee ID"
-                    },
-                    "action": {
-                        "type": "string",
-                        "description": "Attendance action (checkin, checkout)",
-                        "enum": ["checkin", "checkout"]
-                    },
-                    "date": {
-                        "type": "string",
-                        "description": "Date in YYYY-MM-DD format (default: today)"
-                    }
-                },
-                "required": ["employee_id", "action"]
-            }
-        ),
-        Tool(
-            name="get_employee_stats",
-            description="Get comprehensive statistics for an employee",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "employee_id": {
-                        "type": "string",
-                        "description": "Employee ID"
-                    }
-                },
-                "required": ["employee_id"]
-            }
-        ),
-        Tool(
-            name="automated_daily_check",
-            description="Run automated daily checks: evaluate performance, detect risks, check overdue items",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "evaluate_performance": {
-                        "type": "boolean",
-                        "description": "Whether to evaluate all employees (default: True)",
-                        "default": True
-                    },
-        "detect_risks": {
-            "type": "boolean",
-            "description": "Whether to detect risks (default: False - feature removed)",
-            "default": False
-        },
-                    "check_overdue": {
-                        "type": "boolean",
-                        "description": "Whether to check for overdue tasks/goals (default: True)",
-                        "default": True
-                    }
-                }
-            }
-        ),
-        # New Atlas Integration Tools
-        Tool(
-            name="get_user_performance",
-            description="Get comprehensive performance data for a user (combines Atlas task data with local performance data)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {
-                        "type": "string",
-                        "description": "User ID from Atlas"
-                    },
-                    "time_period": {
-                        "type": "string",
-                        "description": "Time period for analysis (monthly, quarterly, yearly)",
-                        "enum": ["monthly", "quarterly", "yearly"],
-                        "default": "quarterly"
-                    },
-                    "atlas_token": {
-                        "type": "string",
-                        "description": "Atlas JWT token for API access"
-                    }
-                },
-                "required": ["user_id", "atlas_token"]
-            }
-        ),
-        Tool(
-            name="create_performance_review",
-            description="Create a new performance review for an employee",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "employee_id": {
-                        "type": "string",
-                        "description": "Employee ID from Atlas"
-                    },
-                    "review_period_start": {
-                        "type": "string",
-                        "description": "Review period start date (YYYY-MM-DD)"
-                    },
-                    "review_period_end": {
-                        "type": "string",
-                        "description": "Review period end date (YYYY-MM-DD)"
-                    },
-                    "overall_rating": {
-                        "type": "number",
-                        "description": "Overall performance rating (0-100)"
-                    },
-                    "strengths": {
-                        "type": "string",
-                        "description": "Employee strengths"
-                    },
-                    "areas_for_improvement": {
-                        "type": "string",
-                        "description": "Areas for improvement"
-                    },
-                    "atlas_token": {
-                        "type": "string",
-                        "description": "Atlas JWT token"
-                    }
-                },
-                "required": ["employee_id", "review_period_start", "review_period_end", "atlas_token"]
-            }
-        ),
-        Tool(
-            name="set_performance_goal",
-            description="Set a performance goal for a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {
-                        "type": "string",
-                        "description": "User ID from Atlas"
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Goal title"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Goal description"
-                    },
-                    "goal_type": {
-                        "type": "string",
-                        "description": "Goal type",
-                        "enum": ["quantitative", "qualitative", "skill_based"]
-                    },
-                    "target_value": {
-                        "type": "number",
-                        "description": "Target value for quantitative goals"
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Goal start date (YYYY-MM-DD)"
-                    },
-                    "target_date": {
-                        "type": "string",
-                        "description": "Goal target date (YYYY-MM-DD)"
-                    },
-                    "atlas_token": {
-                        "type": "string",
-                        "description": "Atlas JWT token"
-                    }
-                },
-                "required": ["user_id", "title", "goal_type", "start_date", "target_date", "atlas_token"]
-            }
-        ),
-        Tool(
-            name="get_team_performance",
-            description="Get team performance analytics for an organization",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "organization_id": {
-                        "type": "string",
-                        "description": "Organization ID from Atlas"
-                    },
-                    "atlas_token": {
-                        "type": "string",
-                        "description": "Atlas JWT token"
-                    }
-                },
-                "required": ["organization_id", "atlas_token"]
-            }
-        ),
-        Tool(
-            name="submit_peer_feedback",
-            description="Submit peer feedback for an employee",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "employee_id": {
-                        "type": "string",
-                        "description": "Employee ID receiving feedback"
-                    },
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID from Atlas (optional)"
-                    },
-                    "feedback_type": {
-                        "type": "string",
-                        "description": "Type of feedback",
-                        "enum": ["positive", "constructive", "general"]
-                    },
-                    "rating": {
-                        "type": "number",
-                        "description": "Rating (1-5 scale)"
-                    },
-                    "feedback_text": {
-                        "type": "string",
-                        "description": "Feedback text"
-                    },
-                    "is_anonymous": {
-                        "type": "boolean",
-                        "description": "Whether feedback is anonymous",
-                        "default": False
-                    },
-                    "atlas_token": {
-                        "type": "string",
-                        "description": "Atlas JWT token"
-                    }
-                },
-                "required": ["employee_id", "feedback_type", "rating", "feedback_text", "atlas_token"]
+# Agents are imported and built on first use, so a process that only serves a
+# few tools never loads the others (or their ML/AI dependencies)
+@functools.lru_cache(maxsize=None)
+def _get_performance_agent():
+    from components.agents.performance_agent import EnhancedPerformanceAgent
+    return EnhancedPerformanceAgent(data_manager)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_notification_agent():
+    from components.agents.notification_agent import NotificationAgent
+    return NotificationAgent(data_manager)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_reporting_agent():
+    from components.agents.reporting_agent import ReportingAgent
+    return ReportingAgent(data_manager)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_export_agent():
+    from components.agents.export_agent import ExportAgent
+    return ExportAgent(data_manager)
+
+
+# Optional flag accepted by every tool; responses are compact JSON unless it is set
+_PRETTY_PROPERTY = {
+    "type": "boolean",
+    "description": "Indent the JSON response for human reading (default: False)",
+    "default": False
+}
+
+# Static tool definitions, built once at import
+_TOOLS = [
+    Tool(
+        name="evaluate_all_employees",
+        description="Automatically evaluate performance for all employees",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "save_results": {
+                    "type": "boolean",
+                    "description": "Whether to save evaluation results (default: True)",
+                    "default": True
+                },
+                "pretty": _PRETTY_PROPERTY
             }
-        ),
-        Tool(
-            name="assess_skills",
-            description="Assess skills for a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {
-                        "type": "string",
-                        "description": "User ID from Atlas"
-                    },
-                    "skill_name": {
-                        "type": "string",
-                        "description": "Name of the skill"
-                    },
-                    "skill_category": {
-                        "type": "string",
-                        "description": "Skill category",
-                        "enum": ["technical", "soft", "domain"]
-                    },
-                    "proficiency_level": {
-                        "type": "string",
-                        "description": "Proficiency level",
-                        "enum": ["beginner", "intermediate", "advanced", "expert"]
-                    },
-                    "proficiency_score": {
-                        "type": "number",
-                        "description": "Proficiency score (0-100)"
-                    },
-                    "assessment_method": {
-                        "type": "string",
-                        "description": "Assessment method",
-                        "enum": ["self", "peer", "manager", "test"]
-                    },
-                    "atlas_token": {
-                        "type": "string",
-                        "description": "Atlas JWT token"
-                    }
-                },
-                "required": ["user_id", "skill_name", "proficiency_level", "proficiency_score", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="detect_all_risks",
+        description="Automatically detect all risks in the system (employees, projects, tasks, performance)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pretty": _PRETTY_PROPERTY
             }
-        ),
-        Tool(
-            name="identify_skill_gaps",
-            description="Identify skill gaps for a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {
-                        "type": "string",
-                        "description": "User ID from Atlas"
-                    },
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID from Atlas (optional)"
-                    },
-                    "atlas_token": {
-                        "type": "string",
-                        "description": "Atlas JWT token"
-                    }
-                },
-                "required": ["user_id", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="send_notification",
+        description="Send a notification to an employee",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "employee_id": {
+                    "type": "string",
+                    "description": "Employee ID to send notification to"
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Notification title"
+                },
+                "message": {
+                    "type": "string",
+                    "description": "Notification message"
+                },
+                "notification_type": {
+                    "type": "string",
+                    "description": "Type of notification (info, warning, success, error)",
+                    "enum": ["info", "warning", "success", "error"]
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["employee_id", "title", "message"]
+        }
+    ),
+    Tool(
+        name="generate_performance_report",
+        description="Generate a performance report for an employee",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "employee_id": {
+                    "type": "string",
+                    "description": "Employee ID to generate report for"
+                },
+                "format": {
+                    "type": "string",
+                    "description": "Report format (json, pdf, csv)",
+                    "enum": ["json", "pdf", "csv"],
+                    "default": "json"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["employee_id"]
+        }
+    ),
+    Tool(
+        name="check_overdue_tasks",
+        description="Check for overdue tasks and send notifications",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "send_notifications": {
+                    "type": "boolean",
+                    "description": "Whether to send notifications for overdue tasks (default: True)",
+                    "default": True
+                },
+                "pretty": _PRETTY_PROPERTY
             }
-        ),
-        Tool(
-            name="track_goal_progress",
-            description="Update goal progress",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "goal_id": {
-                        "type": "integer",
-                        "description": "Goal ID"
-                    },
-                    "current_value": {
-                        "type": "number",
-                        "description": "Current progress value"
-                    },
-                    "status": {
-                        "type": "string",
-                        "description": "Goal status",
-                        "enum": ["in_progress", "achieved", "missed"]
-                    },
-                    "atlas_token": {
-                        "type": "string",
-                        "description": "Atlas JWT token"
-                    }
-                },
-                "required": ["goal_id", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="check_overdue_goals",
+        description="Check for overdue goals and send notifications",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "send_notifications": {
+                    "type": "boolean",
+                    "description": "Whether to send notifications for overdue goals (default: True)",
+                    "default": True
+                },
+                "pretty": _PRETTY_PROPERTY
             }
-        ),
-        Tool(
-            name="generate_performance_report_api",
-            description="Generate performance report via API (quarterly, monthly, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {
-                        "type": "string",
-                        "description": "User ID from Atlas"
-                    },
-                    "report_type": {
-                        "type": "string",
-                        "description": "Report type",
-                        "enum": ["quarterly", "monthly", "yearly"],
-                        "default": "quarterly"
-                    },
-                    "quarter": {
-                        "type": "integer",
-                        "description": "Quarter number (1-4) for quarterly reports"
-                    },
-                    "year": {
-                        "type": "integer",
-                        "description": "Year for the report"
-                    },
-                    "atlas_token": {
-                        "type": "string",
-                        "description": "Atlas JWT token"
-                    }
-                },
-                "required": ["user_id", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="assess_workload",
+        description="Assess workload for all employees and identify overloaded employees",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "threshold": {
+                    "type": "integer",
+                    "description": "Maximum number of active tasks before considered overloaded (default: 10)",
+                    "default": 10
+                },
+                "pretty": _PRETTY_PROPERTY
             }
-        ),
-        Tool(
-            name="predict_performance_trend",
-            description="Predict performance trend for a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {
-                        "type": "string",
-                        "description": "User ID from Atlas"
-                    },
-                    "prediction_months": {
-                        "type": "integer",
-                        "description": "Number of months to predict ahead",
-                        "default": 3
-                    },
-                    "atlas_token": {
-                        "type": "string",
-                        "description": "Atlas JWT token"
-                    }
-                },
-                "required": ["user_id", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="generate_project_report",
+        description="Generate a comprehensive report for a project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "Project ID to generate report for"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["project_id"]
+        }
+    ),
+    Tool(
+        name="export_data",
+        description="Export data to CSV or PDF format",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "data_type": {
+                    "type": "string",
+                    "description": "Type of data to export",
+                    "enum": ["projects", "tasks", "employees", "performances", "goals", "feedback"]
+                },
+                "format": {
+                    "type": "string",
+                    "description": "Export format (csv, pdf)",
+                    "enum": ["csv", "pdf"],
+                    "default": "csv"
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Optional output file path"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["data_type"]
+        }
+    ),
+    Tool(
+        name="record_attendance",
+        description="Record employee attendance (check-in or check-out)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "employee_id": {
+                    "type": "string",
+                    "description": "Employee ID"
+                },
+                "action": {
+                    "type": "string",
+                    "description": "Attendance action (checkin, checkout)",
+                    "enum": ["checkin", "checkout"]
+                },
+                "date": {
+                    "type": "string",
+                    "description": "Date in YYYY-MM-DD format (default: today)"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["employee_id", "action"]
+        }
+    ),
+    Tool(
+        name="get_employee_stats",
+        description="Get comprehensive statistics for an employee",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "employee_id": {
+                    "type": "string",
+                    "description": "Employee ID"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["employee_id"]
+        }
+    ),
+    Tool(
+        name="automated_daily_check",
+        description="Run automated daily checks: evaluate performance, detect risks, check overdue items",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "evaluate_performance": {
+                    "type": "boolean",
+                    "description": "Whether to evaluate all employees (default: True)",
+                    "default": True
+                },
+    "detect_risks": {
+        "type": "boolean",
+        "description": "Whether to detect risks (default: False - feature removed)",
+        "default": False
+    },
+                "check_overdue": {
+                    "type": "boolean",
+                    "description": "Whether to check for overdue tasks/goals (default: True)",
+                    "default": True
+                },
+                "pretty": _PRETTY_PROPERTY
             }
-        )
-    ]
+        }
+    ),
+    # New Atlas Integration Tools
+    Tool(
+        name="get_user_performance",
+        description="Get comprehensive performance data for a user (combines Atlas task data with local performance data)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {
+                    "type": "string",
+                    "description": "User ID from Atlas"
+                },
+                "time_period": {
+                    "type": "string",
+                    "description": "Time period for analysis (monthly, quarterly, yearly)",
+                    "enum": ["monthly", "quarterly", "yearly"],
+                    "default": "quarterly"
+                },
+                "atlas_token": {
+                    "type": "string",
+                    "description": "Atlas JWT token for API access"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["user_id", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="create_performance_review",
+        description="Create a new performance review for an employee",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "employee_id": {
+                    "type": "string",
+                    "description": "Employee ID from Atlas"
+                },
+                "review_period_start": {
+                    "type": "string",
+                    "description": "Review period start date (YYYY-MM-DD)"
+                },
+                "review_period_end": {
+                    "type": "string",
+                    "description": "Review period end date (YYYY-MM-DD)"
+                },
+                "overall_rating": {
+                    "type": "number",
+                    "description": "Overall performance rating (0-100)"
+                },
+                "strengths": {
+                    "type": "string",
+                    "description": "Employee strengths"
+                },
+                "areas_for_improvement": {
+                    "type": "string",
+                    "description": "Areas for improvement"
+                },
+                "atlas_token": {
+                    "type": "string",
+                    "description": "Atlas JWT token"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["employee_id", "review_period_start", "review_period_end", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="set_performance_goal",
+        description="Set a performance goal for a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {
+                    "type": "string",
+                    "description": "User ID from Atlas"
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Goal title"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Goal description"
+                },
+                "goal_type": {
+                    "type": "string",
+                    "description": "Goal type",
+                    "enum": ["quantitative", "qualitative", "skill_based"]
+                },
+                "target_value": {
+                    "type": "number",
+                    "description": "Target value for quantitative goals"
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "Goal start date (YYYY-MM-DD)"
+                },
+                "target_date": {
+                    "type": "string",
+                    "description": "Goal target date (YYYY-MM-DD)"
+                },
+                "atlas_token": {
+                    "type": "string",
+                    "description": "Atlas JWT token"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["user_id", "title", "goal_type", "start_date", "target_date", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="get_team_performance",
+        description="Get team performance analytics for an organization",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "organization_id": {
+                    "type": "string",
+                    "description": "Organization ID from Atlas"
+                },
+                "atlas_token": {
+                    "type": "string",
+                    "description": "Atlas JWT token"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["organization_id", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="submit_peer_feedback",
+        description="Submit peer feedback for an employee",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "employee_id": {
+                    "type": "string",
+                    "description": "Employee ID receiving feedback"
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project ID from Atlas (optional)"
+                },
+                "feedback_type": {
+                    "type": "string",
+                    "description": "Type of feedback",
+                    "enum": ["positive", "constructive", "general"]
+                },
+                "rating": {
+                    "type": "number",
+                    "description": "Rating (1-5 scale)"
+                },
+                "feedback_text": {
+                    "type": "string",
+                    "description": "Feedback text"
+                },
+                "is_anonymous": {
+                    "type": "boolean",
+                    "description": "Whether feedback is anonymous",
+                    "default": False
+                },
+                "atlas_token": {
+                    "type": "string",
+                    "description": "Atlas JWT token"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["employee_id", "feedback_type", "rating", "feedback_text", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="assess_skills",
+        description="Assess skills for a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {
+                    "type": "string",
+                    "description": "User ID from Atlas"
+                },
+                "skill_name": {
+                    "type": "string",
+                    "description": "Name of the skill"
+                },
+                "skill_category": {
+                    "type": "string",
+                    "description": "Skill category",
+                    "enum": ["technical", "soft", "domain"]
+                },
+                "proficiency_level": {
+                    "type": "string",
+                    "description": "Proficiency level",
+                    "enum": ["beginner", "intermediate", "advanced", "expert"]
+                },
+                "proficiency_score": {
+                    "type": "number",
+                    "description": "Proficiency score (0-100)"
+                },
+                "assessment_method": {
+                    "type": "string",
+                    "description": "Assessment method",
+                    "enum": ["self", "peer", "manager", "test"]
+                },
+                "atlas_token": {
+                    "type": "string",
+                    "description": "Atlas JWT token"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["user_id", "skill_name", "proficiency_level", "proficiency_score", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="identify_skill_gaps",
+        description="Identify skill gaps for a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {
+                    "type": "string",
+                    "description": "User ID from Atlas"
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project ID from Atlas (optional)"
+                },
+                "atlas_token": {
+                    "type": "string",
+                    "description": "Atlas JWT token"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["user_id", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="track_goal_progress",
+        description="Update goal progress",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "goal_id": {
+                    "type": "integer",
+                    "description": "Goal ID"
+                },
+                "current_value": {
+                    "type": "number",
+                    "description": "Current progress value"
+                },
+                "status": {
+                    "type": "string",
+                    "description": "Goal status",
+                    "enum": ["in_progress", "achieved", "missed"]
+                },
+                "atlas_token": {
+                    "type": "string",
+                    "description": "Atlas JWT token"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["goal_id", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="generate_performance_report_api",
+        description="Generate performance report via API (quarterly, monthly, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {
+                    "type": "string",
+                    "description": "User ID from Atlas"
+                },
+                "report_type": {
+                    "type": "string",
+                    "description": "Report type",
+                    "enum": ["quarterly", "monthly", "yearly"],
+                    "default": "quarterly"
+                },
+                "quarter": {
+                    "type": "integer",
+                    "description": "Quarter number (1-4) for quarterly reports"
+                },
+                "year": {
+                    "type": "integer",
+                    "description": "Year for the report"
+                },
+                "atlas_token": {
+                    "type": "string",
+                    "description": "Atlas JWT token"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["user_id", "atlas_token"]
+        }
+    ),
+    Tool(
+        name="predict_performance_trend",
+        description="Predict performance trend for a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {
+                    "type": "string",
+                    "description": "User ID from Atlas"
+                },
+                "prediction_months": {
+                    "type": "integer",
+                    "description": "Number of months to predict ahead",
+                    "default": 3
+                },
+                "atlas_token": {
+                    "type": "string",
+                    "description": "Atlas JWT token"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["user_id", "atlas_token"]
+        }
+    )
+]
+
+
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    """List all available automation tools"""
+    return _TOOLS
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle tool calls"""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(
+            type="text",
+            text=f"Unknown tool: {name}"
+        )]
+    
     try:
-        if name == "evaluate_all_employees":
-            return await handle_evaluate_all_employees(arguments)
-        elif name == "detect_all_risks":
-            return await handle_detect_all_risks(arguments)
-        elif name == "send_notification":
-            return await handle_send_notification(arguments)
-        elif name == "generate_performance_report":
-            return await handle_generate_performance_report(arguments)
-        elif name == "check_overdue_tasks":
-            return await handle_check_overdue_tasks(arguments)
-        elif name == "check_overdue_goals":
-            return await handle_check_overdue_goals(arguments)
-        elif name == "assess_workload":
-            return await handle_assess_workload(arguments)
-        elif name == "generate_project_report":
-            return await handle_generate_project_report(arguments)
-        elif name == "export_data":
-            return await handle_export_data(arguments)
-        elif name == "record_attendance":
-            return await handle_record_attendance(arguments)
-        elif name == "get_employee_stats":
-            return await handle_get_employee_stats(arguments)
-        elif name == "automated_daily_check":
-            return await handle_automated_daily_check(arguments)
-        # New Atlas Integration Tools
-        elif name == "get_user_performance":
-            return await handle_get_user_performance(arguments)
-        elif name == "create_performance_review":
-            return await handle_create_performance_review(arguments)
-        elif name == "set_performance_goal":
-            return await handle_set_performance_goal(arguments)
-        elif name == "get_team_performance":
-            return await handle_get_team_performance(arguments)
-        elif name == "submit_peer_feedback":
-            return await handle_submit_peer_feedback(arguments)
-        elif name == "assess_skills":
-            return await handle_assess_skills(arguments)
-        elif name == "identify_skill_gaps":
-            return await handle_identify_skill_gaps(arguments)
-        elif name == "track_goal_progress":
-            return await handle_track_goal_progress(arguments)
-        elif name == "generate_performance_report_api":
-            return await handle_generate_performance_report_api(arguments)
-        elif name == "predict_performance_trend":
-            return await handle_predict_performance_trend(arguments)
-        else:
-            return [TextContent(
-                type="text",
-                text=f"Unknown tool: {name}"
-            )]
+        return await handler(arguments)
     except Exception as e:
         return [TextContent(
             type="text",
@@ -653,46 +703,133 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         )]
 
 
+# Datasets preloaded for the request being handled (see handle_automated_daily_check)
+_request_data: ContextVar[Optional[Dict[str, List[Dict[str, Any]]]]] = ContextVar("_request_data", default=None)
+
+
+def _load(filename: str) -> List[Dict[str, Any]]:
+    """Load a dataset, reusing the copy preloaded for the current request if there is one"""
+    preloaded = _request_data.get()
+    if preloaded is not None and filename in preloaded:
+        return preloaded[filename]
+    return data_manager.load_data(filename) or []
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON response body straight from bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-JSON values agents return; orjson already handles datetimes and UUIDs natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date, dt_time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    # Anything else is stringified, as json.dumps(default=str) did before
+    return str(obj)
+
+
+def _dump(payload: Any, pretty: bool = False) -> str:
+    """Serialize a tool response payload to JSON text (compact unless pretty is requested)"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option, default=_json_default).decode()
+    if pretty:
+        return json.dumps(payload, indent=2, default=_json_default)
+    return json.dumps(payload, separators=(",", ":"), default=_json_default)
+
+
+def _ack(message: str, status: str = "success", pretty: bool = False, **extra: Any) -> List[TextContent]:
+    """Build a short status/message acknowledgement response"""
+    return [TextContent(
+        type="text",
+        text=_dump({"status": status, "message": message, **extra}, pretty=pretty)
+    )]
+
+
+def _index_by(items: Iterable[Dict[str, Any]], key: str) -> Dict[Any, List[Dict[str, Any]]]:
+    """Group records by the value of one field in a single pass"""
+    index = defaultdict(list)
+    for item in items:
+        index[item.get(key)].append(item)
+    return index
+
+
+def _is_overdue(iso_date: Optional[str], today_iso: str) -> bool:
+    """Check an ISO-8601 date against today; ISO strings sort chronologically, so no parsing is needed"""
+    return bool(iso_date) and iso_date < today_iso
+
+
 # Tool handlers
-async def handle_evaluate_all_employees(arguments: Dict[str, Any]) -> List[TextContent]:
+# Tool implementations return plain dicts so handle_automated_daily_check can
+# embed them directly; the handle_* wrappers serialize them once
+async def _evaluate_all_employees_impl(save_results: bool = True) -> Dict[str, Any]:
     """Evaluate performance for all employees"""
-    save_results = arguments.get("save_results", True)
-    employees = data_manager.load_data("employees") or []
+    employees = [e for e in await asyncio.to_thread(_load, "employees") if e.get("id")]
+    evaluate_employee = _get_performance_agent().evaluate_employee
+    
+    # Evaluations are independent and blocking, so run them in the default
+    # executor, bounded to avoid exhausting its thread pool
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(EVALUATION_CONCURRENCY)
+    
+    async def evaluate(employee_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await loop.run_in_executor(
+                None,
+                functools.partial(evaluate_employee, employee_id, save=save_results)
+            )
+    
+    evaluations = await asyncio.gather(*(evaluate(e["id"]) for e in employees))
     
     results = []
-    for employee in employees:
-        employee_id = employee.get("id")
-        if employee_id:
-            evaluation = performance_agent.evaluate_employee(employee_id, save=save_results)
-            results.append({
-                "employee_id": employee_id,
-                "employee_name": employee.get("name"),
-                "performance_score": evaluation.get("performance_score", 0),
-                "completion_rate": evaluation.get("completion_rate", 0),
-                "on_time_rate": evaluation.get("on_time_rate", 0),
-                "rank": evaluation.get("rank", "N/A")
-            })
+    for employee, evaluation in zip(employees, evaluations):
+        results.append({
+            "employee_id": employee["id"],
+            "employee_name": employee.get("name"),
+            "performance_score": evaluation.get("performance_score", 0),
+            "completion_rate": evaluation.get("completion_rate", 0),
+            "on_time_rate": evaluation.get("on_time_rate", 0),
+            "rank": evaluation.get("rank", "N/A")
+        })
     
-    return [TextContent(
-        type="text",
-        text=json.dumps({
-            "status": "success",
-            "message": f"Evaluated {len(results)} employees",
-            "results": results
-        }, indent=2)
-    )]
+    return {
+        "status": "success",
+        "message": f"Evaluated {len(results)} employees",
+        "results": results
+    }
 
 
-async def handle_detect_all_risks(arguments: Dict[str, Any]) -> List[TextContent]:
+async def handle_evaluate_all_employees(arguments: Dict[str, Any]) -> List[TextContent]:
+    """Evaluate performance for all employees"""
+    result = await _evaluate_all_employees_impl(arguments.get("save_results", True))
+    return [TextContent(type="text", text=_dump(result, pretty=arguments.get("pretty", False)))]
+
+
+async def _detect_all_risks_impl() -> Dict[str, Any]:
     """Detect all risks in the system"""
     # Risk detection removed - use reporting agent for project risks
-    return [TextContent(
-        type="text",
-        text=json.dumps({
-            "status": "not_implemented",
-            "message": "Risk detection agent removed. Use reporting agent for project risk analysis."
-        }, indent=2)
-    )]
+    return {
+        "status": "not_implemented",
+        "message": "Risk detection agent removed. Use reporting agent for project risk analysis."
+    }
+
+
+async def handle_detect_all_risks(arguments: Dict[str, Any]) -> List[TextContent]:
+    """Detect all risks in the system"""
+    result = await _detect_all_risks_impl()
+    return [TextContent(type="text", text=_dump(result, pretty=arguments.get("pretty", False)))]
 
 
 async def handle_send_notification(arguments: Dict[str, Any]) -> List[TextContent]:
@@ -702,20 +839,15 @@ async def handle_send_notification(arguments: Dict[str, Any]) -> List[TextConten
     message = arguments["message"]
     notification_type = arguments.get("notification_type", "info")
     
-    notification_agent.send_notification(
+    await asyncio.to_thread(
+        _get_notification_agent().send_notification,
         recipient=employee_id,
         title=title,
         message=message,
         notification_type=notification_type
     )
     
-    return [TextContent(
-        type="text",
-        text=json.dumps({
-            "status": "success",
-            "message": f"Notification sent to employee {employee_id}"
-        }, indent=2)
-    )]
+    return _ack(f"Notification sent to employee {employee_id}", pretty=arguments.get("pretty", False))
 
 
 async def handle_generate_performance_report(arguments: Dict[str, Any]) -> List[TextContent]:
@@ -723,128 +855,148 @@ async def handle_generate_performance_report(arguments: Dict[str, Any]) -> List[
     employee_id = arguments["employee_id"]
     format_type = arguments.get("format", "json")
     
-    evaluation = performance_agent.evaluate_employee(employee_id, save=False)
-    
     if format_type == "json":
+        evaluation = await asyncio.to_thread(_get_performance_agent().evaluate_employee, employee_id, save=False)
         return [TextContent(
             type="text",
-            text=json.dumps(evaluation, indent=2, default=str)
+            text=_dump(evaluation, pretty=arguments.get("pretty", False))
         )]
     else:
         # For PDF/CSV, use export agent
-        result = export_agent.export_performance_report(employee_id, format_type)
-        return [TextContent(
-            type="text",
-            text=json.dumps({
-                "status": "success",
-                "message": f"Report generated in {format_type} format",
-                "file_path": result.get("file_path", "N/A")
-            }, indent=2)
-        )]
+        result = await asyncio.to_thread(_get_export_agent().export_performance_report, employee_id, format_type)
+        return _ack(
+            f"Report generated in {format_type} format",
+            file_path=result.get("file_path", "N/A"),
+            pretty=arguments.get("pretty", False)
+        )
+
+
+async def _check_overdue_tasks_impl(send_notifications: bool = True, now_iso: Optional[str] = None) -> Dict[str, Any]:
+    """Check for overdue tasks, relative to now_iso (default: the current time)"""
+    tasks = await asyncio.to_thread(_load, "tasks")
+    today_iso = now_iso or datetime.now().isoformat()
+    
+    overdue_tasks = [
+        task for task in tasks
+        if task.get("status") not in _DONE_STATUSES
+        and _is_overdue(task.get("due_date"), today_iso)
+    ]
+    
+    if send_notifications:
+        pending = [
+            {
+                "recipient": task["assigned_to"],
+                "title": OVERDUE_TASK_TITLE,
+                "message": f"Task '{task.get('title')}' is overdue. Due date: {task['due_date'][:10]}",
+                "notification_type": OVERDUE_NOTIFICATION_TYPE
+            }
+            for task in overdue_tasks if task.get("assigned_to")
+        ]
+        if pending:
+            try:
+                await asyncio.to_thread(_get_notification_agent().send_notifications_bulk, pending)
+            except Exception as e:
+                print(f"Error sending overdue task notifications: {e}")
+    
+    return {
+        "status": "success",
+        "overdue_count": len(overdue_tasks),
+        "overdue_tasks": overdue_tasks
+    }
 
 
 async def handle_check_overdue_tasks(arguments: Dict[str, Any]) -> List[TextContent]:
     """Check for overdue tasks"""
-    send_notifications = arguments.get("send_notifications", True)
-    tasks = data_manager.load_data("tasks") or []
-    today = datetime.now()
+    result = await _check_overdue_tasks_impl(arguments.get("send_notifications", True))
+    return [TextContent(type="text", text=_dump(result, pretty=arguments.get("pretty", False)))]
+
+
+async def _check_overdue_goals_impl(send_notifications: bool = True, now_iso: Optional[str] = None) -> Dict[str, Any]:
+    """Check for overdue goals, relative to now_iso (default: the current time)"""
+    goals = await asyncio.to_thread(_load, "goals")
+    today_iso = now_iso or datetime.now().isoformat()
     
-    overdue_tasks = []
-    for task in tasks:
-        if task.get("status") not in ["completed", "cancelled"] and task.get("due_date"):
+    overdue_goals = [
+        goal for goal in goals
+        if goal.get("status") not in _DONE_STATUSES
+        and _is_overdue(goal.get("deadline"), today_iso)
+    ]
+    
+    if send_notifications:
+        pending = [
+            {
+                "recipient": goal["employee_id"],
+                "title": OVERDUE_GOAL_TITLE,
+                "message": f"Goal '{goal.get('title')}' is overdue. Deadline: {goal['deadline'][:10]}",
+                "notification_type": OVERDUE_NOTIFICATION_TYPE
+            }
+            for goal in overdue_goals if goal.get("employee_id")
+        ]
+        if pending:
             try:
-                due_date = datetime.fromisoformat(task["due_date"])
-                if due_date < today:
-                    overdue_tasks.append(task)
-                    if send_notifications and task.get("assigned_to"):
-                        notification_agent.send_notification(
-                            recipient=task["assigned_to"],
-                            title="Overdue Task",
-                            message=f"Task '{task.get('title')}' is overdue. Due date: {due_date.strftime('%Y-%m-%d')}",
-                            notification_type="warning"
-                        )
-            except:
-                pass
+                await asyncio.to_thread(_get_notification_agent().send_notifications_bulk, pending)
+            except Exception as e:
+                print(f"Error sending overdue goal notifications: {e}")
     
-    return [TextContent(
-        type="text",
-        text=json.dumps({
-            "status": "success",
-            "overdue_count": len(overdue_tasks),
-            "overdue_tasks": overdue_tasks
-        }, indent=2, default=str)
-    )]
+    return {
+        "status": "success",
+        "overdue_count": len(overdue_goals),
+        "overdue_goals": overdue_goals
+    }
 
 
 async def handle_check_overdue_goals(arguments: Dict[str, Any]) -> List[TextContent]:
     """Check for overdue goals"""
-    send_notifications = arguments.get("send_notifications", True)
-    goals = data_manager.load_data("goals") or []
-    today = datetime.now()
-    
-    overdue_goals = []
-    for goal in goals:
-        if goal.get("status") not in ["completed", "cancelled"] and goal.get("deadline"):
-            try:
-                deadline = datetime.fromisoformat(goal["deadline"])
-                if deadline < today:
-                    overdue_goals.append(goal)
-                    if send_notifications and goal.get("employee_id"):
-                        notification_agent.send_notification(
-                            recipient=goal["employee_id"],
-                            title="Overdue Goal",
-                            message=f"Goal '{goal.get('title')}' is overdue. Deadline: {deadline.strftime('%Y-%m-%d')}",
-                            notification_type="warning"
-                        )
-            except:
-                pass
-    
-    return [TextContent(
-        type="text",
-        text=json.dumps({
-            "status": "success",
-            "overdue_count": len(overdue_goals),
-            "overdue_goals": overdue_goals
-        }, indent=2, default=str)
-    )]
+    result = await _check_overdue_goals_impl(arguments.get("send_notifications", True))
+    return [TextContent(type="text", text=_dump(result, pretty=arguments.get("pretty", False)))]
 
 
 async def handle_assess_workload(arguments: Dict[str, Any]) -> List[TextContent]:
     """Assess workload for all employees"""
     threshold = arguments.get("threshold", 10)
-    employees = data_manager.load_data("employees") or []
-    tasks = data_manager.load_data("tasks") or []
+    # The per-employee work is an in-memory tally; the two blocking loads are
+    # what dominate, so fetch them side by side
+    employees, tasks = await asyncio.gather(
+        asyncio.to_thread(_load, "employees"),
+        asyncio.to_thread(_load, "tasks")
+    )
+    
+    # Index active tasks by assignee once instead of rescanning per employee
+    active_tasks = _index_by(
+        (t for t in tasks if t.get("status") in ACTIVE_TASK_STATUSES),
+        "assigned_to"
+    )
     
     workload_results = []
     for employee in employees:
         employee_id = employee.get("id")
         if employee_id:
-            employee_tasks = [t for t in tasks if t.get("assigned_to") == employee_id and t.get("status") in ["pending", "in_progress"]]
+            active_count = len(active_tasks.get(employee_id, ()))
             workload_results.append({
                 "employee_id": employee_id,
                 "employee_name": employee.get("name"),
-                "active_tasks": len(employee_tasks),
-                "overloaded": len(employee_tasks) > threshold
+                "active_tasks": active_count,
+                "overloaded": active_count > threshold
             })
     
     return [TextContent(
         type="text",
-        text=json.dumps({
+        text=_dump({
             "status": "success",
             "threshold": threshold,
             "results": workload_results
-        }, indent=2, default=str)
+        }, pretty=arguments.get("pretty", False))
     )]
 
 
 async def handle_generate_project_report(arguments: Dict[str, Any]) -> List[TextContent]:
     """Generate a project report"""
     project_id = arguments["project_id"]
-    report = reporting_agent.generate_project_report(project_id)
+    report = await asyncio.to_thread(_get_reporting_agent().generate_project_report, project_id)
     
     return [TextContent(
         type="text",
-        text=json.dumps(report, indent=2, default=str)
+        text=_dump(report, pretty=arguments.get("pretty", False))
     )]
 
 
@@ -854,106 +1006,185 @@ async def handle_export_data(arguments: Dict[str, Any]) -> List[TextContent]:
     format_type = arguments.get("format", "csv")
     output_path = arguments.get("output_path")
     
-    data = data_manager.load_data(data_type) or []
+    data = await asyncio.to_thread(_load, data_type)
     
+    export_agent = _get_export_agent()
     if format_type == "csv":
-        result = export_agent.export_to_csv(data, output_path=output_path)
+        result = await asyncio.to_thread(export_agent.export_to_csv, data, output_path=output_path)
     else:
-        result = export_agent.export_to_pdf(data, output_path=output_path)
+        result = await asyncio.to_thread(export_agent.export_to_pdf, data, output_path=output_path)
     
-    return [TextContent(
-        type="text",
-        text=json.dumps({
-            "status": "success",
-            "message": f"Data exported to {format_type}",
-            "file_path": result.get("file_path", "N/A")
-        }, indent=2)
-    )]
+    return _ack(
+        f"Data exported to {format_type}",
+        file_path=result.get("file_path", "N/A"),
+        pretty=arguments.get("pretty", False)
+    )
 
 
 async def handle_record_attendance(arguments: Dict[str, Any]) -> List[TextContent]:
     """Record employee attendance"""
     # Attendance agent removed - feature not implemented
-    return [TextContent(
-        type="text",
-        text=json.dumps({
-            "status": "not_implemented",
-            "message": "Attendance tracking agent removed."
-        }, indent=2)
-    )]
+    return _ack(
+        "Attendance tracking agent removed.",
+        status="not_implemented",
+        pretty=arguments.get("pretty", False)
+    )
 
 
 async def handle_get_employee_stats(arguments: Dict[str, Any]) -> List[TextContent]:
     """Get comprehensive employee statistics"""
     employee_id = arguments["employee_id"]
     
-    # Get performance evaluation
-    performance = performance_agent.evaluate_employee(employee_id, save=False)
-    
-    # Get workload (simple calculation)
-    tasks = data_manager.load_data("tasks") or []
-    employee_tasks = [t for t in tasks if t.get("assigned_to") == employee_id and t.get("status") in ["pending", "in_progress"]]
-    workload = {"active_tasks": len(employee_tasks)}
-    
-    # Get tasks
-    tasks = data_manager.load_data("tasks") or []
-    employee_tasks = [t for t in tasks if t.get("assigned_to") == employee_id]
+    # The evaluation and both loads block, so run them side by side off the event loop
+    performance, tasks, goals = await asyncio.gather(
+        asyncio.to_thread(_get_performance_agent().evaluate_employee, employee_id, save=False),
+        asyncio.to_thread(_load, "tasks"),
+        asyncio.to_thread(_load, "goals")
+    )
     
-    # Get goals
-    goals = data_manager.load_data("goals") or []
-    employee_goals = [g for g in goals if g.get("employee_id") == employee_id]
+    # Tally task and goal statuses in a single pass each
+    task_counts = Counter(t.get("status") for t in tasks if t.get("assigned_to") == employee_id)
+    goal_counts = Counter(g.get("status") for g in goals if g.get("employee_id") == employee_id)
     
     stats = {
         "employee_id": employee_id,
         "performance": performance,
-        "workload": workload,
+        "workload": {"active_tasks": task_counts["pending"] + task_counts["in_progress"]},
         "tasks": {
-            "total": len(employee_tasks),
-            "completed": len([t for t in employee_tasks if t.get("status") == "completed"]),
-            "pending": len([t for t in employee_tasks if t.get("status") == "pending"]),
-            "in_progress": len([t for t in employee_tasks if t.get("status") == "in_progress"])
+            "total": sum(task_counts.values()),
+            "completed": task_counts["completed"],
+            "pending": task_counts["pending"],
+            "in_progress": task_counts["in_progress"]
         },
         "goals": {
-            "total": len(employee_goals),
-            "completed": len([g for g in employee_goals if g.get("status") == "completed"]),
-            "active": len([g for g in employee_goals if g.get("status") == "active"])
+            "total": sum(goal_counts.values()),
+            "completed": goal_counts["completed"],
+            "active": goal_counts["active"]
         }
     }
     
     return [TextContent(
         type="text",
-        text=json.dumps(stats, indent=2, default=str)
+        text=_dump(stats, pretty=arguments.get("pretty", False))
     )]
 
 
 async def handle_automated_daily_check(arguments: Dict[str, Any]) -> List[TextContent]:
     """Run automated daily checks"""
+    # One reference time shared by every check, so they agree on what "now" is
+    now_iso = datetime.now().isoformat()
     results = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso,
         "checks": {}
     }
     
-    if arguments.get("evaluate_performance", True):
-        eval_result = await handle_evaluate_all_employees({"save_results": True})
-        results["checks"]["performance_evaluation"] = json.loads(eval_result[0].text)
+    evaluate_performance = arguments.get("evaluate_performance", True)
+    detect_risks = arguments.get("detect_risks", True)
+    check_overdue = arguments.get("check_overdue", True)
     
-    if arguments.get("detect_risks", True):
-        # Risk detection removed
-        results["checks"]["risk_detection"] = json.loads(risk_result[0].text)
+    datasets = []
+    if evaluate_performance:
+        datasets.append("employees")
+    if check_overdue:
+        datasets.extend(["tasks", "goals"])
     
-    if arguments.get("check_overdue", True):
-        task_result = await handle_check_overdue_tasks({"send_notifications": True})
-        results["checks"]["overdue_tasks"] = json.loads(task_result[0].text)
-        
-        goal_result = await handle_check_overdue_goals({"send_notifications": True})
-        results["checks"]["overdue_goals"] = json.loads(goal_result[0].text)
+    # Load every dataset the checks need once, up front and off the event loop;
+    # the gathered checks inherit this context and read from it instead of reloading
+    preloaded = await asyncio.to_thread(data_manager.load_many, datasets)
+    token = _request_data.set(preloaded)
+    try:
+        # The checks touch disjoint data, so run them concurrently. They are
+        # created only now so a failed preload leaves no un-awaited coroutines
+        checks = {}
+        if evaluate_performance:
+            checks["performance_evaluation"] = _evaluate_all_employees_impl(save_results=True)
+        if detect_risks:
+            checks["risk_detection"] = _detect_all_risks_impl()
+        if check_overdue:
+            checks["overdue_tasks"] = _check_overdue_tasks_impl(send_notifications=True, now_iso=now_iso)
+            checks["overdue_goals"] = _check_overdue_goals_impl(send_notifications=True, now_iso=now_iso)
+        check_results = await asyncio.gather(*checks.values(), return_exceptions=True)
+    finally:
+        _request_data.reset(token)
+    
+    # A failing check is reported in place instead of discarding the others
+    for check_name, check_result in zip(checks, check_results):
+        if isinstance(check_result, Exception):
+            results["checks"][check_name] = {"status": "error", "message": str(check_result)}
+        else:
+            results["checks"][check_name] = check_result
     
     return [TextContent(
         type="text",
-        text=json.dumps(results, indent=2, default=str)
+        text=_dump(results, pretty=arguments.get("pretty", False))
     )]
 
 
+# Identical Atlas GETs currently in flight, so concurrent callers share one request
+_atlas_inflight: Dict[Any, "asyncio.Future[Any]"] = {}
+
+# Recent Atlas GET responses: key -> (expiry on the monotonic clock, decoded JSON)
+ATLAS_CACHE_TTL = 30.0
+ATLAS_CACHE_MAXSIZE = 256
+_atlas_cache: Dict[Any, Tuple[float, Any]] = {}
+_atlas_cache_generation = 0
+
+
+def clear_atlas_cache() -> None:
+    """Drop cached Atlas responses; called after any write to the Atlas API"""
+    global _atlas_cache_generation
+    _atlas_cache.clear()
+    _atlas_cache_generation += 1
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.blake2s(token.encode()).hexdigest()
+
+
+async def _atlas_get(path: str, token: str, params: Optional[Dict[str, Any]] = None, raw: bool = False) -> Any:
+    """GET an Atlas endpoint and return the decoded JSON (or, with raw, the JSON body text
+    as sent), served from a short TTL cache and coalescing identical concurrent requests"""
+    # repr() the param values so unhashable ones (e.g. lists) still make a usable key
+    key = (path, tuple(sorted((k, repr(v)) for k, v in (params or {}).items())), _token_digest(token), raw)
+    cached = _atlas_cache.get(key)
+    if cached is not None:
+        if time.monotonic() < cached[0]:
+            return cached[1]
+        del _atlas_cache[key]
+    
+    request = _atlas_inflight.get(key)
+    if request is None:
+        async def fetch() -> Any:
+            generation = _atlas_cache_generation
+            response = await _get_http_client().get(
+                path,
+                params=params,
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            response.raise_for_status()
+            data = response.text if raw else _loads(response.content)
+            # Skip caching if a write cleared the cache while this request was in flight
+            if generation == _atlas_cache_generation:
+                if len(_atlas_cache) >= ATLAS_CACHE_MAXSIZE:
+                    _atlas_cache.pop(next(iter(_atlas_cache)))
+                _atlas_cache[key] = (time.monotonic() + ATLAS_CACHE_TTL, data)
+            return data
+        
+        request = asyncio.ensure_future(fetch())
+        _atlas_inflight[key] = request
+        request.add_done_callback(lambda _: _atlas_inflight.pop(key, None))
+    # Shield so one caller being cancelled does not cancel the shared request
+    return await asyncio.shield(request)
+
+
+async def _atlas_report(path: str, token: str, params: Optional[Dict[str, Any]] = None, pretty: bool = False) -> str:
+    """Fetch a (potentially large) Atlas report as JSON text; the upstream body is already
+    JSON, so unless pretty output is requested it is passed through without re-encoding"""
+    if pretty:
+        return _dump(await _atlas_get(path, token, params=params), pretty=True)
+    return await _atlas_get(path, token, params=params, raw=True)
+
+
 # Atlas Integration Tool Handlers
 async def handle_get_user_performance(arguments: Dict[str, Any]) -> List[TextContent]:
     """Get user performance via API"""
@@ -962,69 +1193,69 @@ async def handle_get_user_performance(arguments: Dict[str, Any]) -> List[TextCon
     token = arguments.get("atlas_token")
     
     if not token:
-        return [TextContent(type="text", text=json.dumps({"error": "Atlas token required"}))]
+        return [TextContent(type="text", text=_dump({"error": "Atlas token required"}))]
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"http://localhost:8003/api/v1/analytics/user/{user_id}/performance",
-                params={"time_period": time_period},
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+        data = await _atlas_get(
+            f"/api/v1/analytics/user/{user_id}/performance",
+            token,
+            params={"time_period": time_period}
+        )
+        return [TextContent(type="text", text=_dump(data, pretty=arguments.get("pretty", False)))]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dump({"error": str(e)}))]
 
 async def handle_create_performance_review(arguments: Dict[str, Any]) -> List[TextContent]:
     """Create performance review via API"""
     token = arguments.get("atlas_token")
     if not token:
-        return [TextContent(type="text", text=json.dumps({"error": "Atlas token required"}))]
+        return [TextContent(type="text", text=_dump({"error": "Atlas token required"}))]
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "http://localhost:8003/api/v1/reviews",
-                json={
-                    "employee_id": arguments.get("employee_id"),
-                    "review_period_start": arguments.get("review_period_start"),
-                    "review_period_end": arguments.get("review_period_end"),
-                    "overall_rating": arguments.get("overall_rating"),
-                    "strengths": arguments.get("strengths"),
-                    "areas_for_improvement": arguments.get("areas_for_improvement")
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+        client = _get_http_client()
+        response = await client.post(
+            "/api/v1/reviews",
+            json={
+                "employee_id": arguments.get("employee_id"),
+                "review_period_start": arguments.get("review_period_start"),
+                "review_period_end": arguments.get("review_period_end"),
+                "overall_rating": arguments.get("overall_rating"),
+                "strengths": arguments.get("strengths"),
+                "areas_for_improvement": arguments.get("areas_for_improvement")
+            },
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        clear_atlas_cache()
+        return [TextContent(type="text", text=_dump(_loads(response.content), pretty=arguments.get("pretty", False)))]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dump({"error": str(e)}))]
 
 async def handle_set_performance_goal(arguments: Dict[str, Any]) -> List[TextContent]:
     """Set performance goal via API"""
     token = arguments.get("atlas_token")
     if not token:
-        return [TextContent(type="text", text=json.dumps({"error": "Atlas token required"}))]
+        return [TextContent(type="text", text=_dump({"error": "Atlas token required"}))]
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "http://localhost:8003/api/v1/goals",
-                json={
-                    "title": arguments.get("title"),
-                    "description": arguments.get("description"),
-                    "goal_type": arguments.get("goal_type"),
-                    "target_value": arguments.get("target_value"),
-                    "start_date": arguments.get("start_date"),
-                    "target_date": arguments.get("target_date")
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+        client = _get_http_client()
+        response = await client.post(
+            "/api/v1/goals",
+            json={
+                "title": arguments.get("title"),
+                "description": arguments.get("description"),
+                "goal_type": arguments.get("goal_type"),
+                "target_value": arguments.get("target_value"),
+                "start_date": arguments.get("start_date"),
+                "target_date": arguments.get("target_date")
+            },
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        clear_atlas_cache()
+        return [TextContent(type="text", text=_dump(_loads(response.content), pretty=arguments.get("pretty", False)))]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dump({"error": str(e)}))]
 
 async def handle_get_team_performance(arguments: Dict[str, Any]) -> List[TextContent]:
     """Get team performance via API"""
@@ -1032,67 +1263,64 @@ async def handle_get_team_performance(arguments: Dict[str, Any]) -> List[TextCon
     token = arguments.get("atlas_token")
     
     if not token:
-        return [TextContent(type="text", text=json.dumps({"error": "Atlas token required"}))]
+        return [TextContent(type="text", text=_dump({"error": "Atlas token required"}))]
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"http://localhost:8003/api/v1/analytics/team/{org_id}/performance",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+        text = await _atlas_report(f"/api/v1/analytics/team/{org_id}/performance", token, pretty=arguments.get("pretty", False))
+        return [TextContent(type="text", text=text)]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dump({"error": str(e)}))]
 
 async def handle_submit_peer_feedback(arguments: Dict[str, Any]) -> List[TextContent]:
     """Submit peer feedback via API"""
     token = arguments.get("atlas_token")
     if not token:
-        return [TextContent(type="text", text=json.dumps({"error": "Atlas token required"}))]
+        return [TextContent(type="text", text=_dump({"error": "Atlas token required"}))]
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "http://localhost:8003/api/v1/feedback",
-                json={
-                    "employee_id": arguments.get("employee_id"),
-                    "project_id": arguments.get("project_id"),
-                    "feedback_type": arguments.get("feedback_type"),
-                    "rating": arguments.get("rating"),
-                    "feedback_text": arguments.get("feedback_text"),
-                    "is_anonymous": arguments.get("is_anonymous", False)
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+        client = _get_http_client()
+        response = await client.post(
+            "/api/v1/feedback",
+            json={
+                "employee_id": arguments.get("employee_id"),
+                "project_id": arguments.get("project_id"),
+                "feedback_type": arguments.get("feedback_type"),
+                "rating": arguments.get("rating"),
+                "feedback_text": arguments.get("feedback_text"),
+                "is_anonymous": arguments.get("is_anonymous", False)
+            },
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        clear_atlas_cache()
+        return [TextContent(type="text", text=_dump(_loads(response.content), pretty=arguments.get("pretty", False)))]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dump({"error": str(e)}))]
 
 async def handle_assess_skills(arguments: Dict[str, Any]) -> List[TextContent]:
     """Assess skills via API"""
     token = arguments.get("atlas_token")
     if not token:
-        return [TextContent(type="text", text=json.dumps({"error": "Atlas token required"}))]
+        return [TextContent(type="text", text=_dump({"error": "Atlas token required"}))]
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "http://localhost:8003/api/v1/skills/assess",
-                json={
-                    "skill_name": arguments.get("skill_name"),
-                    "skill_category": arguments.get("skill_category"),
-                    "proficiency_level": arguments.get("proficiency_level"),
-                    "proficiency_score": arguments.get("proficiency_score"),
-                    "assessment_method": arguments.get("assessment_method")
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+        client = _get_http_client()
+        response = await client.post(
+            "/api/v1/skills/assess",
+            json={
+                "skill_name": arguments.get("skill_name"),
+                "skill_category": arguments.get("skill_category"),
+                "proficiency_level": arguments.get("proficiency_level"),
+                "proficiency_score": arguments.get("proficiency_score"),
+                "assessment_method": arguments.get("assessment_method")
+            },
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        clear_atlas_cache()
+        return [TextContent(type="text", text=_dump(_loads(response.content), pretty=arguments.get("pretty", False)))]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dump({"error": str(e)}))]
 
 async def handle_identify_skill_gaps(arguments: Dict[str, Any]) -> List[TextContent]:
     """Identify skill gaps via API"""
@@ -1101,21 +1329,14 @@ async def handle_identify_skill_gaps(arguments: Dict[str, Any]) -> List[TextCont
     token = arguments.get("atlas_token")
     
     if not token:
-        return [TextContent(type="text", text=json.dumps({"error": "Atlas token required"}))]
+        return [TextContent(type="text", text=_dump({"error": "Atlas token required"}))]
     
     try:
-        async with httpx.AsyncClient() as client:
-            url = f"http://localhost:8003/api/v1/skills/gaps/{user_id}"
-            params = {"project_id": project_id} if project_id else {}
-            response = await client.get(
-                url,
-                params=params,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+        params = {"project_id": project_id} if project_id else {}
+        data = await _atlas_get(f"/api/v1/skills/gaps/{user_id}", token, params=params)
+        return [TextContent(type="text", text=_dump(data, pretty=arguments.get("pretty", False)))]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dump({"error": str(e)}))]
 
 async def handle_track_goal_progress(arguments: Dict[str, Any]) -> List[TextContent]:
     """Track goal progress via API"""
@@ -1123,22 +1344,23 @@ async def handle_track_goal_progress(arguments: Dict[str, Any]) -> List[TextCont
     token = arguments.get("atlas_token")
     
     if not token:
-        return [TextContent(type="text", text=json.dumps({"error": "Atlas token required"}))]
+        return [TextContent(type="text", text=_dump({"error": "Atlas token required"}))]
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"http://localhost:8003/api/v1/goals/{goal_id}/progress",
-                json={
-                    "current_value": arguments.get("current_value"),
-                    "status": arguments.get("status")
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+        client = _get_http_client()
+        response = await client.put(
+            f"/api/v1/goals/{goal_id}/progress",
+            json={
+                "current_value": arguments.get("current_value"),
+                "status": arguments.get("status")
+            },
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        clear_atlas_cache()
+        return [TextContent(type="text", text=_dump(_loads(response.content), pretty=arguments.get("pretty", False)))]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dump({"error": str(e)}))]
 
 async def handle_generate_performance_report_api(arguments: Dict[str, Any]) -> List[TextContent]:
     """Generate performance report via API"""
@@ -1147,34 +1369,25 @@ async def handle_generate_performance_report_api(arguments: Dict[str, Any]) -> L
     token = arguments.get("atlas_token")
     
     if not token:
-        return [TextContent(type="text", text=json.dumps({"error": "Atlas token required"}))]
+        return [TextContent(type="text", text=_dump({"error": "Atlas token required"}))]
     
     try:
-        async with httpx.AsyncClient() as client:
-            if report_type == "quarterly":
-                params = {}
-                if arguments.get("quarter"):
-                    params["quarter"] = arguments.get("quarter")
-                if arguments.get("year"):
-                    params["year"] = arguments.get("year")
-                
-                response = await client.get(
-                    f"http://localhost:8003/api/v1/reports/user/{user_id}/quarterly",
-                    params=params,
-                    headers={"Authorization": f"Bearer {token}"}
-                )
-            else:
-                # For monthly/yearly, use analytics endpoint
-                response = await client.get(
-                    f"http://localhost:8003/api/v1/analytics/user/{user_id}/performance",
-                    params={"time_period": report_type},
-                    headers={"Authorization": f"Bearer {token}"}
-                )
+        if report_type == "quarterly":
+            path = f"/api/v1/reports/user/{user_id}/quarterly"
+            params = {}
+            if arguments.get("quarter"):
+                params["quarter"] = arguments.get("quarter")
+            if arguments.get("year"):
+                params["year"] = arguments.get("year")
+        else:
+            # For monthly/yearly, use analytics endpoint
+            path = f"/api/v1/analytics/user/{user_id}/performance"
+            params = {"time_period": report_type}
             
-            response.raise_for_status()
-            return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+        text = await _atlas_report(path, token, params=params, pretty=arguments.get("pretty", False))
+        return [TextContent(type="text", text=text)]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dump({"error": str(e)}))]
 
 async def handle_predict_performance_trend(arguments: Dict[str, Any]) -> List[TextContent]:
     """Predict performance trend via API"""
@@ -1183,29 +1396,62 @@ async def handle_predict_performance_trend(arguments: Dict[str, Any]) -> List[Te
     token = arguments.get("atlas_token")
     
     if not token:
-        return [TextContent(type="text", text=json.dumps({"error": "Atlas token required"}))]
+        return [TextContent(type="text", text=_dump({"error": "Atlas token required"}))]
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "http://localhost:8003/api/v1/analytics/predict",
-                json={
-                    "user_id": user_id,
-                    "prediction_months": prediction_months
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+        client = _get_http_client()
+        response = await client.post(
+            "/api/v1/analytics/predict",
+            json={
+                "user_id": user_id,
+                "prediction_months": prediction_months
+            },
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return [TextContent(type="text", text=_dump(_loads(response.content), pretty=arguments.get("pretty", False)))]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dump({"error": str(e)}))]
+
+
+# Tool name -> handler dispatch table
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]] = {
+    "evaluate_all_employees": handle_evaluate_all_employees,
+    "detect_all_risks": handle_detect_all_risks,
+    "send_notification": handle_send_notification,
+    "generate_performance_report": handle_generate_performance_report,
+    "check_overdue_tasks": handle_check_overdue_tasks,
+    "check_overdue_goals": handle_check_overdue_goals,
+    "assess_workload": handle_assess_workload,
+    "generate_project_report": handle_generate_project_report,
+    "export_data": handle_export_data,
+    "record_attendance": handle_record_attendance,
+    "get_employee_stats": handle_get_employee_stats,
+    "automated_daily_check": handle_automated_daily_check,
+    # Atlas Integration Tools
+    "get_user_performance": handle_get_user_performance,
+    "create_performance_review": handle_create_performance_review,
+    "set_performance_goal": handle_set_performance_goal,
+    "get_team_performance": handle_get_team_performance,
+    "submit_peer_feedback": handle_submit_peer_feedback,
+    "assess_skills": handle_assess_skills,
+    "identify_skill_gaps": handle_identify_skill_gaps,
+    "track_goal_progress": handle_track_goal_progress,
+    "generate_performance_report_api": handle_generate_performance_report_api,
+    "predict_performance_trend": handle_predict_performance_trend
+}
+
 
 async def main():
     """Main entry point for the MCP server"""
     # Create stdio transport
     transport = stdio_server()
-    # Run the server with the transport
-    await server.run(transport, server.create_initialization_options())
+    try:
+        # Run the server with the transport
+        await server.run(transport, server.create_initialization_options())
+    finally:
+        if _atlas_client is not None:
+            await _atlas_client.aclose()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,23 @@
 """
 Start the FastAPI backend server
 """
+import os
 import uvicorn
 
+# Auto-reload is a development convenience; it runs a file watcher and a
+# supervisor process and cannot be combined with multiple workers
+RELOAD = os.getenv("API_RELOAD", "false").lower() == "true"
+WORKERS = int(os.getenv("API_WORKERS", "1"))
+
 if __name__ == "__main__":
     uvicorn.run(
         "api.main:app",
         host="0.0.0.0",
         port=8003,
-        reload=True
+        reload=RELOAD,
+        workers=WORKERS,
+        # uvicorn[standard] installs uvloop and httptools; "auto" uses them
+        # where available and falls back on platforms without uvloop (Windows)
+        loop="auto",
+        http="auto"
     )
-
@@ -4,34 +4,165 @@ This script trains the Random Forest/XGBoost model for performance scoring using
 """
 import sys
 import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import time
+import hashlib
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import json
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import numpy as np
 
 from components.managers.data_manager import DataManager
 from components.ml.performance_scorer import PerformanceScorer
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
-def prepare_training_data(data_manager: DataManager) -> tuple[List[Dict[str, Any]], List[float]]:
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Choices and weights used by the synthetic data generator
+TASK_STATUSES = ("pending", "in_progress", "completed")
+TASK_STATUS_WEIGHTS = (0.2, 0.3, 0.5)
+TASK_PRIORITIES = ("low", "medium", "high")
+ATTENDANCE_STATUSES = ("present", "absent")
+ATTENDANCE_STATUS_WEIGHTS = (0.9, 0.1)
+ACTIVE_TASK_STATUSES = ("pending", "in_progress")
+ACTIVE_TASK_STATUS_IDX = tuple(TASK_STATUSES.index(status) for status in ACTIVE_TASK_STATUSES)
+MAX_SYNTHETIC_TASKS = 30
+MAX_SYNTHETIC_FEEDBACKS = 10
+ATTENDANCE_DAYS = 30
+
+# Tables read by the training pipeline
+TRAINING_TABLES = ("employees", "tasks", "feedback", "performances", "attendance")
+# Age (seconds) after which a cached Parquet snapshot of a table is re-downloaded
+TABLE_CACHE_TTL = 24 * 60 * 60
+# Below this many samples, Dask scheduling overhead outweighs distributed training
+DASK_MIN_SAMPLES = 100_000
+
+
+@lru_cache(maxsize=100_000)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp (accepting a trailing Z); memoized since HR rows share timestamps"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _iso_timestamp(value: Any) -> Optional[Tuple[float, bool]]:
+    """
+    (timestamp, is_aware) for an ISO string, or None if it is missing or malformed
+    
+    Naive values are read as UTC, which keeps their wall-clock order without depending
+    on the local timezone; they are only ever compared with other naive values.
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = _parse_iso(value)
+        aware = parsed.utcoffset() is not None
+        if not aware:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp(), aware
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def _task_timeline(tasks: List[Dict[str, Any]]) -> Optional[tuple]:
+    """
+    Split one employee's tasks into undated tasks and dated tasks sorted by creation time
+    
+    Returns:
+        tuple: (timestamps, dated_tasks, undated_tasks, awareness), where awareness is the set
+        of is_aware flags seen on creation times; None if a creation time cannot be parsed
+    """
+    undated = []
+    dated = []
+    awareness = set()
+    for task in tasks:
+        created_at = task.get("created_at")
+        if not created_at:
+            undated.append(task)
+            continue
+        created = _iso_timestamp(created_at)
+        if created is None:
+            return None
+        awareness.add(created[1])
+        dated.append((created[0], task))
+    dated.sort(key=lambda item: item[0])
+    return [ts for ts, _ in dated], [task for _, task in dated], undated, awareness
+
+
+def load_tables(data_manager: DataManager, cache_dir: Optional[str] = None,
+                refresh: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Load every table in TRAINING_TABLES
+    
+    With cache_dir, tables are read from Parquet snapshots there when they are younger
+    than TABLE_CACHE_TTL; missing or stale tables (or all of them, with refresh) are
+    fetched from Supabase and written back to the cache.
+    """
+    if cache_dir and not PYARROW_AVAILABLE:
+        print("⚠️ pyarrow not available, ignoring cache. Install with: pip install pyarrow")
+        cache_dir = None
+    if not cache_dir:
+        return data_manager.load_many(TRAINING_TABLES)
+    
+    os.makedirs(cache_dir, exist_ok=True)
+    paths = {name: os.path.join(cache_dir, f"{name}.parquet") for name in TRAINING_TABLES}
+    
+    tables = {}
+    stale = []
+    for name, path in paths.items():
+        if not refresh and os.path.exists(path) and time.time() - os.path.getmtime(path) < TABLE_CACHE_TTL:
+            tables[name] = pq.read_table(path).to_pylist()
+        else:
+            stale.append(name)
+    if tables:
+        print(f"   Loaded {len(tables)} cached tables from {cache_dir}")
+    
+    for name, rows in data_manager.load_many(stale).items():
+        tables[name] = rows
+        try:
+            # Union of keys across rows (from_pylist would only keep the first row's keys);
+            # keys missing from a row read back as None, which .get() treats the same
+            columns = list(dict.fromkeys(key for row in rows for key in row))
+            table = pa.Table.from_pydict({key: [row.get(key) for row in rows] for key in columns})
+            pq.write_table(table, paths[name])
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            # Rows whose columns mix types can't be stored as Parquet; just skip caching them
+            print(f"⚠️ Could not cache {name}: {e}")
+    
+    return tables
+
+
+def prepare_training_data(tables: Dict[str, List[Dict[str, Any]]]) -> tuple[np.ndarray, np.ndarray]:
     """
     Prepare training data from historical performance records
     
+    Args:
+        tables: Loaded tables by name (see TRAINING_TABLES)
+    
     Returns:
-        tuple: (training_data, target_scores)
-        - training_data: List of employee data dictionaries
-        - target_scores: List of actual performance scores (0-100)
+        tuple: (X, target_scores)
+        - X: Feature matrix (n_samples, n_features), see PerformanceScorer.compute_features
+        - target_scores: Array of actual performance scores (0-100)
     """
     print("📊 Preparing training data from Supabase...")
     
-    # Load all data
-    employees = data_manager.load_data("employees") or []
-    tasks = data_manager.load_data("tasks") or []
-    feedbacks = data_manager.load_data("feedback") or []
-    performances = data_manager.load_data("performances") or []
-    attendance = data_manager.load_data("attendance") or []
+    employees = tables.get("employees") or []
+    tasks = tables.get("tasks") or []
+    feedbacks = tables.get("feedback") or []
+    performances = tables.get("performances") or []
+    attendance = tables.get("attendance") or []
     
     print(f"   Found {len(employees)} employees")
     print(f"   Found {len(tasks)} tasks")
@@ -42,6 +173,25 @@ def prepare_training_data(data_manager: DataManager) -> tuple[List[Dict[str, Any
     training_data = []
     target_scores = []
     
+    # Index tasks by assignee once, with each assignee's tasks pre-parsed and sorted by
+    # creation time, so a record only bisects its own employee's timeline
+    tasks_by_employee = defaultdict(list)
+    for task in tasks:
+        tasks_by_employee[task.get("assigned_to")].append(task)
+    task_timelines = {
+        employee_id: _task_timeline(employee_tasks)
+        for employee_id, employee_tasks in tasks_by_employee.items()
+    }
+    
+    # Bucket feedback and attendance by employee in one pass each; ids are normalized
+    # to str once per row here, so no per-record comparison coerces them again
+    feedbacks_by_employee = defaultdict(list)
+    for feedback in feedbacks:
+        feedbacks_by_employee[str(feedback.get("employee_id", ""))].append(feedback)
+    attendance_by_employee = defaultdict(list)
+    for record in attendance:
+        attendance_by_employee[str(record.get("employee_id", ""))].append(record)
+    
     # Use historical performance records as ground truth
     for perf_record in performances:
         employee_id = perf_record.get("employee_id")
@@ -53,246 +203,229 @@ def prepare_training_data(data_manager: DataManager) -> tuple[List[Dict[str, Any
         if actual_score is None or actual_score < 0 or actual_score > 100:
             continue
         
-        # Get employee's tasks at the time of evaluation
-        evaluated_at = perf_record.get("evaluated_at")
-        if evaluated_at:
-            try:
-                eval_date = datetime.fromisoformat(evaluated_at.replace('Z', '+00:00'))
-                # Get tasks before evaluation date
-                employee_tasks = [
-                    t for t in tasks 
-                    if t.get("assigned_to") == employee_id and
-                    (not t.get("created_at") or 
-                     datetime.fromisoformat(t["created_at"].replace('Z', '+00:00')) <= eval_date)
-                ]
-            except:
-                employee_tasks = [t for t in tasks if t.get("assigned_to") == employee_id]
-        else:
-            employee_tasks = [t for t in tasks if t.get("assigned_to") == employee_id]
-        
-        # Get employee's feedbacks
-        employee_feedbacks = [
-            f for f in feedbacks 
-            if str(f.get("employee_id", "")) == str(employee_id)
-        ]
+        # Get employee's tasks at the time of evaluation (all of them if the dates can't be
+        # used, including when a naive date would have to be compared with an aware one)
+        employee_tasks = tasks_by_employee.get(employee_id, [])
+        evaluated = _iso_timestamp(perf_record.get("evaluated_at"))
+        timeline = task_timelines.get(employee_id)
+        if evaluated is not None and timeline is not None and timeline[3] <= {evaluated[1]}:
+            # Get tasks created up to the evaluation date
+            timestamps, dated_tasks, undated_tasks, _ = timeline
+            employee_tasks = undated_tasks + dated_tasks[:bisect_right(timestamps, evaluated[0])]
         
-        # Get employee's attendance records
-        employee_attendance = [
-            a for a in attendance 
-            if str(a.get("employee_id", "")) == str(employee_id)
-        ]
+        # Get employee's feedbacks and attendance records
+        employee_key = str(employee_id)
+        employee_feedbacks = feedbacks_by_employee.get(employee_key, [])
+        employee_attendance = attendance_by_employee.get(employee_key, [])
         
         # Prepare employee data dictionary
         employee_data = {
             "tasks": employee_tasks,
             "feedbacks": employee_feedbacks,
             "attendance": employee_attendance,
-            "workload": len([t for t in employee_tasks if t.get("status") in ["pending", "in_progress"]])
+            "workload": len([t for t in employee_tasks if t.get("status") in ACTIVE_TASK_STATUSES])
         }
         
         training_data.append(employee_data)
         target_scores.append(float(actual_score))
     
-    print(f"\n✅ Prepared {len(training_data)} training samples")
-    return training_data, target_scores
+    X = PerformanceScorer.compute_features(training_data)
+    print(f"\n✅ Prepared {len(X)} training samples")
+    return X, np.array(target_scores, dtype=float)
 
 
-def generate_synthetic_data(data_manager: DataManager, num_samples: int = 50) -> tuple[List[Dict[str, Any]], List[float]]:
+def generate_synthetic_data(tables: Dict[str, List[Dict[str, Any]]], num_samples: int = 50,
+                            seed: Optional[int] = None) -> tuple[np.ndarray, np.ndarray]:
     """
     Generate synthetic training data if historical data is insufficient
     This creates realistic training examples based on patterns
+    
+    Samples are drawn and featurized as whole arrays; no per-task records are built.
+    The feature columns mirror PerformanceScorer.extract_features for the tasks and
+    feedback each sample represents.
+    
+    Args:
+        tables: Loaded tables by name; only employees are needed
+        seed: Seed for the generator's RNG (fixed seed gives reproducible samples)
+    
+    Returns:
+        tuple: (X, target_scores) as arrays
     """
     print(f"🔧 Generating {num_samples} synthetic training samples...")
     
-    employees = data_manager.load_data("employees") or []
-    tasks = data_manager.load_data("tasks") or []
-    feedbacks = data_manager.load_data("feedback") or []
+    employees = tables.get("employees") or []
     
     if not employees:
         print("❌ No employees found. Cannot generate synthetic data.")
-        return [], []
+        return np.empty((0, len(PerformanceScorer.FEATURE_NAMES)), dtype=np.float32), np.empty(0)
     
-    training_data = []
-    target_scores = []
+    rng = np.random.default_rng(seed)
     
-    import random
-    import numpy as np
+    # Draw all randomness up front as (num_samples, max_per_sample) arrays; each
+    # sample uses the first num_tasks / num_feedbacks columns of its row
+    shape_tasks = (num_samples, MAX_SYNTHETIC_TASKS)
+    shape_feedbacks = (num_samples, MAX_SYNTHETIC_FEEDBACKS)
+    num_tasks = rng.integers(5, MAX_SYNTHETIC_TASKS + 1, size=num_samples)
+    status_idx = rng.choice(len(TASK_STATUSES), size=shape_tasks, p=TASK_STATUS_WEIGHTS)
+    priority_idx = rng.integers(0, len(TASK_PRIORITIES), size=shape_tasks)
+    completed_days_ago = rng.integers(0, 31, size=shape_tasks)
+    due_days_ago = rng.integers(0, 36, size=shape_tasks)
+    # 70% on-time completion
+    on_time = rng.random(shape_tasks) < 0.7
+    num_feedbacks = rng.integers(2, MAX_SYNTHETIC_FEEDBACKS + 1, size=num_samples)
+    ratings = rng.integers(1, 6, size=shape_feedbacks)
+    attendance_idx = rng.choice(
+        len(ATTENDANCE_STATUSES), size=(num_samples, ATTENDANCE_DAYS), p=ATTENDANCE_STATUS_WEIGHTS
+    )
+    noise = rng.uniform(-5, 5, size=num_samples)
     
-    for i in range(num_samples):
-        # Random employee
-        employee = random.choice(employees)
-        employee_id = employee.get("id")
-        
-        # Generate realistic task data
-        num_tasks = random.randint(5, 30)
-        employee_tasks = []
-        completed_count = 0
-        on_time_count = 0
-        
-        for j in range(num_tasks):
-            status = random.choices(
-                ["pending", "in_progress", "completed"],
-                weights=[0.2, 0.3, 0.5]
-            )[0]
-            
-            task = {
-                "id": f"synth_task_{i}_{j}",
-                "assigned_to": employee_id,
-                "status": status,
-                "priority": random.choice(["low", "medium", "high"]),
-                "created_at": (datetime.now() - timedelta(days=random.randint(0, 60))).isoformat()
-            }
-            
-            if status == "completed":
-                completed_count += 1
-                task["completed_at"] = (datetime.now() - timedelta(days=random.randint(0, 30))).isoformat()
-                task["due_date"] = (datetime.now() - timedelta(days=random.randint(0, 35))).isoformat()
-                # 70% on-time completion
-                if random.random() < 0.7:
-                    on_time_count += 1
-            else:
-                task["due_date"] = (datetime.now() + timedelta(days=random.randint(1, 30))).isoformat()
-            
-            employee_tasks.append(task)
-        
-        # Generate feedback data
-        num_feedbacks = random.randint(2, 10)
-        employee_feedbacks = []
-        positive_count = 0
-        negative_count = 0
-        
-        for j in range(num_feedbacks):
-            rating = random.randint(1, 5)
-            feedback = {
-                "id": f"synth_feedback_{i}_{j}",
-                "employee_id": employee_id,
-                "rating": rating,
-                "type": "positive" if rating > 3 else "negative" if rating < 3 else "neutral"
-            }
-            employee_feedbacks.append(feedback)
-            if rating > 3:
-                positive_count += 1
-            elif rating < 3:
-                negative_count += 1
-        
-        # Generate attendance data
-        employee_attendance = []
-        for j in range(30):  # Last 30 days
-            attendance = {
-                "id": f"synth_attendance_{i}_{j}",
-                "employee_id": employee_id,
-                "status": random.choices(["present", "absent"], weights=[0.9, 0.1])[0],
-                "date": (datetime.now() - timedelta(days=30-j)).isoformat()
-            }
-            employee_attendance.append(attendance)
-        
-        # Calculate expected performance score based on features
-        completion_rate = completed_count / num_tasks if num_tasks > 0 else 0
-        on_time_rate = on_time_count / completed_count if completed_count > 0 else 0
-        
-        # Task quality (0-1)
-        task_quality = 0.5
-        if completed_count > 0:
-            task_quality = 0.5 + (on_time_count / completed_count) * 0.3
-            high_priority_completed = sum(1 for t in employee_tasks 
-                                        if t.get("priority") == "high" and t.get("status") == "completed")
-            task_quality += min(0.2, high_priority_completed / completed_count * 0.2)
-        task_quality = min(1.0, task_quality)
-        
-        # Feedback sentiment (0-1)
-        sentiment = 0.5
-        if num_feedbacks > 0:
-            sentiment = 0.5 + (positive_count - negative_count) / (num_feedbacks * 2)
-        sentiment = max(0.0, min(1.0, sentiment))
-        
-        # Attendance (0-1)
-        present_count = sum(1 for a in employee_attendance if a.get("status") == "present")
-        attendance_rate = present_count / len(employee_attendance) if employee_attendance else 0.95
-        
-        # Workload balance (0-1)
-        active_tasks = len([t for t in employee_tasks if t.get("status") in ["pending", "in_progress"]])
-        if active_tasks == 0:
-            workload_balance = 0.3
-        elif active_tasks <= 5:
-            workload_balance = 0.4 + (active_tasks / 5) * 0.1
-        elif active_tasks <= 10:
-            workload_balance = 0.5
-        elif active_tasks <= 15:
-            workload_balance = 0.5 - ((active_tasks - 10) / 5) * 0.2
-        else:
-            workload_balance = 0.2
-        
-        # Calculate target score using weighted average (same as fallback)
-        weights = [0.3, 0.25, 0.25, 0.2]  # task_quality, sentiment, attendance, workload
-        target_score = sum([
-            task_quality * weights[0],
-            sentiment * weights[1],
-            attendance_rate * weights[2],
-            workload_balance * weights[3]
-        ]) * 100
-        
-        # Add some noise to make it more realistic
-        target_score += random.uniform(-5, 5)
-        target_score = max(0.0, min(100.0, target_score))
-        
-        employee_data = {
-            "tasks": employee_tasks,
-            "feedbacks": employee_feedbacks,
-            "attendance": employee_attendance,
-            "workload": active_tasks
-        }
-        
-        training_data.append(employee_data)
-        target_scores.append(target_score)
+    # Per-sample tallies as masked reductions over the drawn arrays
+    task_used = np.arange(MAX_SYNTHETIC_TASKS) < num_tasks[:, None]
+    feedback_used = np.arange(MAX_SYNTHETIC_FEEDBACKS) < num_feedbacks[:, None]
+    completed = task_used & (status_idx == TASK_STATUSES.index("completed"))
+    completed_count = completed.sum(axis=1)
+    on_time_count = (completed & on_time).sum(axis=1)
+    high_priority = completed & (priority_idx == TASK_PRIORITIES.index("high"))
+    high_priority_completed = high_priority.sum(axis=1)
+    active_tasks = (task_used & np.isin(status_idx, ACTIVE_TASK_STATUS_IDX)).sum(axis=1)
+    positive_count = (feedback_used & (ratings > 3)).sum(axis=1)
+    negative_count = (feedback_used & (ratings < 3)).sum(axis=1)
+    present_count = (attendance_idx == ATTENDANCE_STATUSES.index("present")).sum(axis=1)
+    
+    # Task quality (0-1)
+    safe_completed = np.maximum(completed_count, 1)
+    task_quality = np.where(
+        completed_count > 0,
+        0.5 + on_time_count / safe_completed * 0.3
+        + np.minimum(0.2, high_priority_completed / safe_completed * 0.2),
+        0.5
+    )
+    task_quality = np.minimum(1.0, task_quality)
+    
+    # Feedback sentiment (0-1)
+    sentiment = np.clip(0.5 + (positive_count - negative_count) / (num_feedbacks * 2), 0.0, 1.0)
+    
+    # Attendance (0-1)
+    attendance_rate = present_count / ATTENDANCE_DAYS
+    
+    # Workload balance (0-1)
+    workload_balance = np.select(
+        [active_tasks == 0, active_tasks <= 5, active_tasks <= 10, active_tasks <= 15],
+        [0.3, 0.4 + (active_tasks / 5) * 0.1, 0.5, 0.5 - ((active_tasks - 10) / 5) * 0.2],
+        default=0.2
+    )
+    
+    # Calculate target score using weighted average (same as fallback),
+    # plus some noise to make it more realistic
+    weights = [0.3, 0.25, 0.25, 0.2]  # task_quality, sentiment, attendance, workload
+    target_scores = (
+        task_quality * weights[0]
+        + sentiment * weights[1]
+        + attendance_rate * weights[2]
+        + workload_balance * weights[3]
+    ) * 100
+    target_scores = np.clip(target_scores + noise, 0.0, 100.0)
+    
+    # Feature matrix, as PerformanceScorer.extract_features would compute it from the
+    # sampled tasks: a completed task is on time when completed no later than due
+    completed_on_time = completed & (completed_days_ago >= due_days_ago)
+    quality_sum = (completed * 0.5 + completed_on_time * 0.3 + high_priority * 0.2).sum(axis=1)
+    feature_task_quality = np.where(completed_count > 0, quality_sum / safe_completed, 0.5)
+    X = np.column_stack([feature_task_quality, sentiment, workload_balance]).astype(np.float32)
+    
+    print(f"✅ Generated {len(X)} synthetic training samples")
+    return X, np.asarray(target_scores)
+
+
+def _training_hash(X: np.ndarray, y: np.ndarray, model_type: str, estimator: Any) -> str:
+    """
+    Content hash of the training inputs, used to skip retraining on unchanged data
     
-    print(f"✅ Generated {len(training_data)} synthetic training samples")
-    return training_data, target_scores
+    Covers the requested model_type and the class of the fitted estimator, since the
+    scorer can fall back to Random Forest or load a saved model of another type.
+    """
+    parts = (model_type.encode(), type(estimator).__name__.encode(), str(X.shape).encode(),
+             np.ascontiguousarray(X).tobytes(), np.ascontiguousarray(y, dtype=float).tobytes())
+    hasher = xxhash.xxh3_128() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update(part)
+    return hasher.hexdigest()
 
 
-def train_model(model_type: str = "random_forest", use_synthetic: bool = False, num_synthetic: int = 100):
+def train_model(model_type: str = "xgboost", use_synthetic: bool = False, num_synthetic: int = 100,
+                seed: Optional[int] = None, n_jobs: int = -1,
+                cache_dir: Optional[str] = None, refresh: bool = False, dask: bool = False,
+                force: bool = False):
     """
     Train the performance scoring ML model
     
     Args:
-        model_type: "random_forest" or "xgboost"
+        model_type: "xgboost" (histogram-based, falls back to Random Forest if xgboost
+            is not installed) or "random_forest"
         use_synthetic: Whether to generate synthetic data if historical data is insufficient
         num_synthetic: Number of synthetic samples to generate
+        seed: Seed for synthetic data generation (None for non-deterministic)
+        n_jobs: Worker threads for model training (-1 = all cores)
+        cache_dir: Directory for Parquet snapshots of the training tables (optional)
+        refresh: Re-download every table even if a fresh snapshot is cached
+        dask: Train XGBoost on a local Dask cluster when there are more than
+            DASK_MIN_SAMPLES samples
+        force: Retrain even if the saved model was trained on identical data
     """
     print("=" * 60)
     print("🚀 Training Performance Scoring ML Model")
     print("=" * 60)
     
-    # Initialize data manager
+    # Initialize data manager and fetch every table once (concurrently, or from cache)
     data_manager = DataManager()
+    tables = load_tables(data_manager, cache_dir=cache_dir, refresh=refresh)
     
     # Prepare training data
-    training_data, target_scores = prepare_training_data(data_manager)
+    X, target_scores = prepare_training_data(tables)
     
     # If not enough data, generate synthetic data
-    if len(training_data) < 20 and use_synthetic:
-        print(f"\n⚠️  Only {len(training_data)} historical samples found.")
+    if len(X) < 20 and use_synthetic:
+        print(f"\n⚠️  Only {len(X)} historical samples found.")
         print("   Generating synthetic data to supplement training...")
-        synth_data, synth_scores = generate_synthetic_data(data_manager, num_synthetic)
-        training_data.extend(synth_data)
-        target_scores.extend(synth_scores)
+        synth_X, synth_scores = generate_synthetic_data(tables, num_synthetic, seed=seed)
+        X = np.vstack([X, synth_X])
+        target_scores = np.concatenate([target_scores, synth_scores])
     
-    if len(training_data) < 10:
-        print(f"\n❌ Insufficient training data: {len(training_data)} samples")
+    if len(X) < 10:
+        print(f"\n❌ Insufficient training data: {len(X)} samples")
         print("   Need at least 10 samples to train the model.")
         print("   Options:")
         print("   1. Add more performance records to Supabase")
         print("   2. Run with --use-synthetic flag to generate synthetic data")
         return False
     
-    print(f"\n📈 Training with {len(training_data)} samples")
+    print(f"\n📈 Training with {len(X)} samples")
     print(f"   Model type: {model_type}")
     
     # Initialize scorer
-    scorer = PerformanceScorer(model_type=model_type)
+    scorer = PerformanceScorer(model_type=model_type, n_jobs=n_jobs)
+    
+    use_dask = dask and len(X) > DASK_MIN_SAMPLES
+    if dask and not use_dask:
+        print(f"   {len(X)} samples is below the Dask threshold ({DASK_MIN_SAMPLES}), training in-process")
+    
+    # Skip training if the saved model was trained on exactly this data
+    hash_path = scorer.model_path + ".hash"
+    if not force and scorer.is_trained and os.path.exists(hash_path):
+        with open(hash_path, "r", encoding="utf-8") as f:
+            if f.read().strip() == _training_hash(X, target_scores, model_type, scorer.model):
+                print("\n✅ Training data unchanged since last run, keeping existing model")
+                print(f"   Model: {scorer.model_path} (use --force to retrain)")
+                return True
     
     # Train model
     try:
-        scorer.train(training_data, target_scores)
+        scorer.train(X, target_scores, use_dask=use_dask)
+        if not scorer.is_trained:
+            print("\n❌ Model was not trained")
+            return False
+        with open(hash_path, "w", encoding="utf-8") as f:
+            f.write(_training_hash(X, target_scores, model_type, scorer.model))
         print("\n✅ Model training completed successfully!")
         print(f"   Model saved to: {scorer.model_path}")
         return True
@@ -310,7 +443,7 @@ if __name__ == "__main__":
     parser.add_argument(
         "--model-type",
         type=str,
-        default="random_forest",
+        default="xgboost",
         choices=["random_forest", "xgboost"],
         help="ML model type to use"
     )
@@ -325,13 +458,52 @@ if __name__ == "__main__":
         default=100,
         help="Number of synthetic samples to generate (if use-synthetic is True)"
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for reproducible synthetic data"
+    )
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=-1,
+        help="Worker threads for model training (-1 = all cores)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Cache downloaded tables as Parquet in this directory and reuse them on retrains"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached tables and download them again"
+    )
+    parser.add_argument(
+        "--dask",
+        action="store_true",
+        help=f"Train XGBoost on a local Dask cluster when there are more than {DASK_MIN_SAMPLES} samples"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Retrain even if the training data is unchanged since the last run"
+    )
     
     args = parser.parse_args()
     
     success = train_model(
         model_type=args.model_type,
         use_synthetic=args.use_synthetic,
-        num_synthetic=args.num_synthetic
+        num_synthetic=args.num_synthetic,
+        seed=args.seed,
+        n_jobs=args.n_jobs,
+        cache_dir=args.cache_dir,
+        refresh=args.refresh,
+        dask=args.dask,
+        force=args.force
     )
     
     if success: